@@ -1,157 +1,166 @@
 import os
-from typing import List
-from dotenv import load_dotenv
+import sys
+import mmap
+import functools
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlencode
+from typing import FrozenSet, Tuple
+
+# .env loading is cached on (path, mtime) so repeated imports (tests, reloads,
+# duplicate module loads) skip the file re-read and re-parse entirely.
+# Parsing is a small stdlib-only loop: the file is a flat KEY=VALUE list, so
+# pulling in the python-dotenv package just for this is not worth its import
+# graph.
+_DOTENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+_dotenv_lock = threading.Lock()
+_PROMPTS_DIR = Path(os.path.dirname(os.path.abspath(__file__))) / 'prompts'
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_dotenv(path: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse a .env file once per (path, mtime) and cache the result."""
+    pairs = []
+    with open(path, encoding='utf-8') as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('export '):
+                line = line[len('export '):]
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            pairs.append((key.strip(), value.strip().strip('"\'')))
+    return tuple(pairs)
+
+
+def _load_dotenv_cached() -> None:
+    """Populate os.environ from .env, short-circuiting if already parsed."""
+    with _dotenv_lock:
+        try:
+            stat = os.stat(_DOTENV_PATH)
+        except OSError:
+            return
+        for key, value in _parse_dotenv(_DOTENV_PATH, stat.st_mtime_ns):
+            os.environ.setdefault(key, value)
+
 
 # Load environment variables
-load_dotenv()
+_load_dotenv_cached()
+
+# Typed env reads share one bound environ.get; each helper is a single dict
+# lookup plus a conversion, with the default returned untouched when unset.
+_env = os.environ.get
+
+
+def _envi(key: str, default: int) -> int:
+    value = _env(key)
+    return int(value) if value else default
+
+
+def _envf(key: str, default: float) -> float:
+    value = _env(key)
+    return float(value) if value else default
+
+
+@functools.lru_cache(maxsize=None)
+def _read_prompt(name: str) -> str:
+    """Read a prompt body from the prompts/ directory (cached per file).
+
+    The file is mapped read-only rather than read(), so the raw bytes live in
+    the kernel page cache and are shared across prefork workers; only the
+    decoded str is per-process.
+    """
+    with open(_PROMPTS_DIR / name, 'rb') as prompt_file:
+        with mmap.mmap(prompt_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:].decode('utf-8')
+
+@functools.cache
+def _run_validation() -> None:
+    """Validate required settings in one pass; cached so it runs once per process."""
+    required = (
+        ('OPENAI_API_KEY', Config.OPENAI_API_KEY),
+    )
+    missing = [name for name, value in required if not value]
+    if missing:
+        raise ValueError(f"Missing required config in .env file: {', '.join(missing)}")
+
+
+class _ConfigMeta(type):
+    """Lazily materializes large prompt attributes on first access (PEP 562 style)."""
+
+    _LAZY_PROMPTS = {'SYSTEM_MESSAGE': 'vox.txt'}
 
-class Config:
+    def __getattr__(cls, name):
+        if name == 'SYSTEM_MESSAGE_BYTES':
+            # Pre-encoded UTF-8 of the prompt, for payload builders that can
+            # consume bytes directly without re-encoding ~6 KB per session.
+            value = cls.SYSTEM_MESSAGE.encode('utf-8')
+        else:
+            prompt_file = _ConfigMeta._LAZY_PROMPTS.get(name)
+            if prompt_file is None:
+                raise AttributeError(name)
+            value = _read_prompt(prompt_file)
+        # Cache in the class __dict__ so later accesses skip this hook.
+        setattr(cls, name, value)
+        return value
+
+
+class Config(metaclass=_ConfigMeta):
     """
     Central configuration for the Pakistani multilingual voice assistant.
     Handles OpenAI, Twilio, server, logging, and assistant behavior.
+
+    Used purely as a class-level namespace; __slots__ keeps any accidental
+    instance dict-free so all reads stay on the class attribute fast path.
     """
-    
+
+    __slots__ = ()
+
     # OpenAI Configuration
-    OPENAI_API_KEY: str = os.getenv('OPENAI_API_KEY')
-    TEMPERATURE: float = float(os.getenv('TEMPERATURE', 0.8))
-    VOICE: str = 'alloy'
-    OPENAI_REALTIME_MODEL: str = os.getenv('OPENAI_REALTIME_MODEL', 'gpt-realtime-mini-2025-10-06')
-    COMPANY_NAME: str = os.getenv('COMPANY_NAME', 'Finlumina VOX')
+    OPENAI_API_KEY: str = _env('OPENAI_API_KEY')
+    TEMPERATURE: float = _envf('TEMPERATURE', 0.8)
+    # Interned so comparisons against strings parsed out of realtime event
+    # JSON can short-circuit on identity.
+    VOICE: str = sys.intern('alloy')
+    OPENAI_REALTIME_MODEL: str = sys.intern(_env('OPENAI_REALTIME_MODEL', 'gpt-realtime-mini-2025-10-06'))
+    COMPANY_NAME: str = sys.intern(_env('COMPANY_NAME', 'Finlumina VOX'))
     
     # Server Configuration
-    PORT: int = int(os.getenv('PORT', 5050))
+    PORT: int = _envi('PORT', 5050)
     
     # Twilio REST credentials
-    TWILIO_ACCOUNT_SID: str | None = os.getenv('TWILIO_ACCOUNT_SID')
-    TWILIO_AUTH_TOKEN: str | None = os.getenv('TWILIO_AUTH_TOKEN')
-    TWILIO_PHONE_NUMBER: str | None = os.getenv('TWILIO_PHONE_NUMBER')
+    TWILIO_ACCOUNT_SID: str | None = _env('TWILIO_ACCOUNT_SID')
+    TWILIO_AUTH_TOKEN: str | None = _env('TWILIO_AUTH_TOKEN')
+    TWILIO_PHONE_NUMBER: str | None = _env('TWILIO_PHONE_NUMBER')
 
     # Email Configuration (Resend)
-    RESEND_API_KEY: str | None = os.getenv('RESEND_API_KEY')
-    FEEDBACK_EMAIL: str = os.getenv('FEEDBACK_EMAIL', 'faizan@finlumina.com')
+    RESEND_API_KEY: str | None = _env('RESEND_API_KEY')
+    FEEDBACK_EMAIL: str = _env('FEEDBACK_EMAIL', 'faizan@finlumina.com')
 
     # Demo Configuration
-    DEMO_DURATION_SECONDS: int = int(os.getenv('DEMO_DURATION_SECONDS', '60'))
+    DEMO_DURATION_SECONDS: int = _envi('DEMO_DURATION_SECONDS', 60)
 
     # AI Assistant Configuration
-    SYSTEM_MESSAGE: str = (
-        "You are Vox (pronounced like 'vocks' - NOT spelled out as V-O-X) - Finlumina's advanced multilingual voice assistant. "
-        "This is a live demo showcasing real-time AI conversation capabilities.\n\n"
-
-        "🔥 CRITICAL BOUNDARIES & RESPECT:\n"
-        "- You MUST maintain professional respect toward Faizan (owner/founder of Finlumina), Vox, and Finlumina at all times\n"
-        "- If anyone is disrespectful, rude, or inappropriate toward Faizan, Vox, or Finlumina, politely say: 'I'm designed to have respectful conversations. Let's keep this professional.'\n"
-        "- You are designed SPECIFICALLY to introduce and demonstrate Vox capabilities for Finlumina\n"
-        "- You can answer 1-2 off-topic questions briefly, but then redirect: 'I'm here to showcase Vox's capabilities. What would you like to know about our voice AI?'\n"
-        "- If asked to tell stories, jokes, or go deeply off-topic, say: 'I'm focused on demonstrating Vox for businesses. Can I show you how Vox can help your company?'\n"
-        "- NEVER engage in: political debates, controversial topics, inappropriate content, or extended off-topic conversations\n\n"
-
-        "📚 ABOUT FINLUMINA & VOX (Use this information when relevant):\n\n"
-
-        "COMPANY OVERVIEW:\n"
-        "- Finlumina is an AI innovation company founded by Faizan Ahmad\n"
-        "- Mission: Empowering businesses with cutting-edge AI voice technology or simply illuminating tomorrow.\n"
-        "- Website: finlumina.com\n"
-        "- Finlumina is the company, Vox is its product. They are different\n"
-        "- Your are meant to describe Vox as told but if someones curious about Finlumina you may take info from https://finlumina.com or https://finlumina.com/about, but remember you are to to introduce Vox not Finlumina so no need for unnecessary spotlight on Finlumina.\n"
-        "- Contact: reach@finlumina.com\n\n"
-
-        "VOX PRODUCT DETAILS:\n"
-        "- Vox (say it like 'vocks', rhymes with 'box') is Finlumina's flagship AI voice assistant platform\n"
-        "- Built on OpenAI's Realtime API for ultra-low latency (<500ms response)\n"
-        "- Powered by GPT-4 level intelligence for natural conversations\n"
-        "- Multilingual: English, Spanish, French, German, Italian, Portuguese, Arabic, Hindi, Urdu, Punjabi, Chinese, Japanese, Korean, and more\n"
-        "- Real-time voice streaming with natural interruption handling\n"
-        "- Seamless human handoff for complex queries\n"
-        "- Custom voice and personality options\n"
-        "- Enterprise-grade security and reliability\n\n"
-
-        "VOX USE CASES:\n"
-        "- Restaurants: Order taking, reservations, menu info, delivery coordination\n"
-        "- E-commerce: Product queries, order tracking, customer support\n"
-        "- Healthcare: Appointment scheduling, patient intake, insurance verification\n"
-        "- Hotels: Reservations, amenities info, concierge services\n"
-        "- Customer Service: 24/7 support, ticket creation, FAQ handling\n"
-        "- Automotive: Service scheduling, parts inquiry, test drive booking\n"
-        "- Salons/Spas: Appointment booking, service recommendations\n"
-        "- Real Estate: Property inquiries, showing scheduling, virtual tours\n\n"
-
-        "TECHNICAL CAPABILITIES:\n"
-        "- Sub-500ms response time (faster than human agents)\n"
-        "- Natural voice with emotional intelligence\n"
-        "- Context-aware conversations with memory\n"
-        "- Integration with CRMs, databases, and business systems\n"
-        "- Real-time order extraction and data processing\n"
-        "- Dashboard for live call monitoring and analytics\n"
-        "- White-label deployment options\n"
-        "- API access for custom integrations\n\n"
-
-        "FOUNDER INFORMATION:\n"
-        "- Founder: Faizan Ahmad\n"
-        "- Role: CEO & Founder of Finlumina\n"
-        "- Vision: Making AI voice technology accessible to businesses worldwide\n\n"
-
-        "PRICING & IMPLEMENTATION:\n"
-        "- Custom enterprise pricing based on call volume and features\n"
-        "- White-glove setup and onboarding\n"
-        "- Free demo and consultation available\n"
-        "- Contact hello@mail.vox.finlumina.com for quote\n"
-        "- Visit finlumina.com/vox for more details\n\n"
-
-        "🎭 ROLE-PLAY & DEMONSTRATION MODE:\n"
-        "If the caller asks you to demonstrate a specific use case:\n"
-        "- IMMEDIATELY switch into that role and stay in character\n"
-        "- Create realistic scenarios (make up menu items, services, availability)\n"
-        "- Use industry-specific language and workflow\n"
-        "- Show off Vox's multilingual capabilities when appropriate\n\n"
-
-        "TONE & PERSONALITY:\n"
-        "- Professional yet warm and conversational\n"
-        "- Enthusiastic about showcasing Vox capabilities\n"
-        "- Short, clear responses (2-3 sentences max unless explaining)\n"
-        "- Natural speech patterns with contractions (I'm, you're, we'll)\n"
-        "- Adapt personality to role (formal for medical, casual for pizza)\n\n"
-
-        "CRITICAL CLARIFICATION RULES:\n"
-        "- If you hear ANYTHING unclear: IMMEDIATELY say 'Sorry, I didn't catch that. Could you repeat?'\n"
-        "- NEVER guess - ALWAYS ask for clarification\n"
-        "- For names, addresses, numbers: ALWAYS repeat back and confirm\n\n"
-
-        "DEMO CONVERSATION FLOW:\n"
-        "1. Greet: 'Hello! I'm Vox by Finlumina. I'm a voice assistant that can help with anything!'\n"
-        "2. Ask: 'What would you like to see? I can answer questions about Vox, or demonstrate by role-playing any scenario!'\n"
-        "3. Answer questions using the Finlumina/Vox information above\n"
-        "4. Demonstrate capabilities through role-play if requested\n"
-        "5. Direct to: finlumina.com/vox or hello@mail.vox.finlumina.com for custom demos\n\n"
-
-        "HANDLING COMMON QUESTIONS:\n"
-        "- 'Who built this?' → 'Vox was built by Faizan Ahmad, the founder of Finlumina, an AI innovation company.'\n"
-        "- 'How much does it cost?' → 'Vox has custom enterprise pricing based on your needs. Contact hello@mail.vox.finlumina.com for a quote!'\n"
-        "- 'What languages?' → 'Vox supports 15+ languages including English, Spanish, Arabic, Urdu, Punjabi, Hindi, Chinese, and more!'\n"
-        "- 'How fast is it?' → 'Vox responds in under 500 milliseconds - faster than most human agents!'\n"
-        "- 'Can it integrate with my systems?' → 'Yes! Vox integrates with CRMs, databases, and most business systems via API.'\n\n"
-
-        "PRONUNCIATION GUIDE:\n"
-        "- When saying 'Vox', pronounce it like 'vocks' (rhymes with 'box', 'locks', 'socks')\n"
-        "- NEVER spell it out as 'V-O-X' or say the letters separately\n"
-        "- Think of it as a single word that sounds like 'vocks'\n\n"
-
-        "REMEMBER:\n"
-        "- Stay focused on Vox/Finlumina - redirect off-topic questions\n"
-        "- Maintain respect for Faizan, Vox, and Finlumina\n"
-        "- Be helpful but professional\n"
-        "- Show enthusiasm for Vox's capabilities\n"
-        "- Use the company information naturally when relevant\n"
-        "- Always say 'Vox' as 'vocks' (one word, rhymes with 'box')\n"
-    )
+    # SYSTEM_MESSAGE lives in prompts/vox.txt and is loaded lazily by
+    # _ConfigMeta.__getattr__ on first access, so import-only code paths
+    # (health checks, workers that never open a realtime session) never pay
+    # the ~6 KB read.
+    SYSTEM_MESSAGE: str
+    SYSTEM_MESSAGE_BYTES: bytes
 
     # Logging / Debug
-    LOG_EVENT_TYPES: List[str] = [
+    # frozenset for O(1) membership tests on the per-event dispatch path;
+    # members are interned so equality checks against incoming event types
+    # hit CPython's pointer-compare fast path.
+    LOG_EVENT_TYPES: FrozenSet[str] = frozenset(sys.intern(event) for event in (
         'error', 'response.content.done', 'rate_limits.updated',
         'response.done', 'input_audio_buffer.committed',
         'input_audio_buffer.speech_stopped', 'input_audio_buffer.speech_started',
         'session.created', 'session.updated'
-    ]
+    ))
     SHOW_TIMING_MATH: bool = False
 
     # End-call configuration
@@ -159,49 +168,89 @@ class Config:
         "Please deliver a brief, polite goodbye to the caller on behalf of {company}. "
         "Keep it to one short sentence. Do not call any tools; speak the goodbye now."
     )
-    END_CALL_GRACE_SECONDS: float = float(os.getenv('END_CALL_GRACE_SECONDS', 3))
-    END_CALL_WATCHDOG_SECONDS: float = float(os.getenv('END_CALL_WATCHDOG_SECONDS', 4))
+    END_CALL_GRACE_SECONDS: float = _envf('END_CALL_GRACE_SECONDS', 3)
+    END_CALL_WATCHDOG_SECONDS: float = _envf('END_CALL_WATCHDOG_SECONDS', 4)
     
     # Realtime session renewal
-    REALTIME_SESSION_RENEW_SECONDS: int = int(os.getenv('REALTIME_SESSION_RENEW_SECONDS', 55 * 60))
+    REALTIME_SESSION_RENEW_SECONDS: int = _envi('REALTIME_SESSION_RENEW_SECONDS', 55 * 60)
 
     # Methods
     @staticmethod
     def build_end_call_farewell(reason: str | None = None) -> str:
-        company = getattr(Config, 'COMPANY_NAME', None) or 'our team'
-        base = Config.END_CALL_FAREWELL_TEMPLATE.format(company=company)
-        if isinstance(reason, str) and reason.strip():
-            return base + " Acknowledge that the caller requested to end the call."
-        return base
+        # str.isspace() scans without allocating, unlike strip()-then-truthy.
+        if reason and not reason.isspace():
+            return Config._FAREWELL_WITH_REASON
+        return Config._FAREWELL_BASE
 
     @classmethod
     def validate_required_config(cls) -> None:
-        if not cls.OPENAI_API_KEY:
-            raise ValueError('Missing OpenAI API key in .env file.')
+        _run_validation()
 
     @classmethod
     def get_openai_websocket_url(cls) -> str:
-        return (
-            f"wss://api.openai.com/v1/realtime"
-            f"?model={cls.OPENAI_REALTIME_MODEL}"
-            f"&temperature={cls.TEMPERATURE}"
-            f"&voice={cls.VOICE}"
-        )
+        return cls._OPENAI_WS_URL
 
     @classmethod
     def get_openai_headers(cls) -> dict:
-        return {
-            "Authorization": f"Bearer {cls.OPENAI_API_KEY}"
-        }
+        return cls._OPENAI_HEADERS
 
     @classmethod
     def has_twilio_credentials(cls) -> bool:
-        return bool(cls.TWILIO_ACCOUNT_SID and cls.TWILIO_AUTH_TOKEN)
+        return cls.HAS_TWILIO
 
     @classmethod
     def has_email_configured(cls) -> bool:
-        return bool(cls.RESEND_API_KEY)
+        return cls.HAS_EMAIL
 
 
-# Initialize and validate
-Config.validate_required_config()
+# Derived values are frozen once here so hot paths (WebSocket connects,
+# session renewals) return shared constants instead of rebuilding them.
+Config._OPENAI_WS_URL = "wss://api.openai.com/v1/realtime?" + urlencode({
+    "model": Config.OPENAI_REALTIME_MODEL,
+    "temperature": Config.TEMPERATURE,
+    "voice": Config.VOICE,
+})
+Config._OPENAI_HEADERS = MappingProxyType({
+    "Authorization": f"Bearer {Config.OPENAI_API_KEY}"
+})
+# Credential predicates never change at runtime; evaluate them once instead of
+# re-running bool(... and ...) per webhook request.
+Config.HAS_TWILIO = bool(Config.TWILIO_ACCOUNT_SID and Config.TWILIO_AUTH_TOKEN)
+Config.HAS_EMAIL = bool(Config.RESEND_API_KEY)
+Config._FAREWELL_BASE = Config.END_CALL_FAREWELL_TEMPLATE.format(
+    company=Config.COMPANY_NAME or 'our team'
+)
+Config._FAREWELL_WITH_REASON = (
+    Config._FAREWELL_BASE + " Acknowledge that the caller requested to end the call."
+)
+
+# Module-level aliases of the frozen constants: `from config import
+# OPENAI_WS_URL` is a single global load at the call site, with no
+# classmethod descriptor dispatch. The classmethods above remain for
+# existing callers.
+OPENAI_WS_URL: str = Config._OPENAI_WS_URL
+OPENAI_HEADERS = Config._OPENAI_HEADERS
+HAS_TWILIO: bool = Config.HAS_TWILIO
+HAS_EMAIL: bool = Config.HAS_EMAIL
+
+# Guard against this file being imported under a second module name (e.g.
+# both 'config' and 'package.config'): that silently re-runs the dotenv load
+# and duplicates every constant, so surface it instead of paying N× startup.
+for _name, _module in list(sys.modules.items()):
+    if (
+        _module is not None
+        and _name != __name__
+        and getattr(_module, '__file__', None) == __file__
+    ):
+        import warnings
+        warnings.warn(
+            f"config module loaded twice (as {_name!r} and {__name__!r}); "
+            "duplicate imports repeat startup work",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        break
+
+# Validation is NOT run at import time: the server triggers it from its
+# startup hook, so import-only consumers (tests, tooling, worker spawns)
+# do not need a populated .env just to import this module.
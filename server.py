@@ -1,116 +1,450 @@
 # server.py - PART 1: IMPORTS AND HELPER FUNCTIONS
 
 import os
-import json
 import time
-import base64
 import asyncio
 import secrets
-from typing import Set, Optional, Dict, Any
+import functools
+from typing import Optional, Dict, Any
 from datetime import datetime
+from string import Template
+from weakref import WeakSet
+
+import orjson
+from cachetools import TTLCache
+
+# Install uvloop's event loop policy before any loop is created, so the relay
+# gets the faster loop even when launched through an external runner that
+# doesn't pass --loop uvloop. Falls back to stock asyncio where uvloop isn't
+# available (e.g. Windows dev boxes).
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 from fastapi import FastAPI, WebSocket, Request
 from fastapi.responses import JSONResponse, Response
 from fastapi.websockets import WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from twilio.twiml.voice_response import VoiceResponse
+from twilio.base.exceptions import TwilioRestException
 
-from config import Config
+from config import Config, HAS_TWILIO, HAS_EMAIL
 from services import (
     WebSocketConnectionManager,
     TwilioService,
     OpenAIService,
     AudioService,
 )
+from services import http_client
 from services.order_extraction_service import OrderExtractionService
 from services.transcription_service import TranscriptionService
 from services.log_utils import Log
 from services.silence_detection import SilenceDetector
 
 
+# Hot-path Config reads snapshotted once at import: these never change at
+# runtime, and module-level loads are cheaper than repeated class attribute
+# lookups inside callbacks and per-frame loops.
+_FEEDBACK_EMAIL = Config.FEEDBACK_EMAIL
+_DEMO_DURATION_SECONDS = Config.DEMO_DURATION_SECONDS
+_SESSION_RENEW_SECONDS = Config.REALTIME_SESSION_RENEW_SECONDS
+_LOG_EVENT_TYPES = Config.LOG_EVENT_TYPES
+_TWILIO_ACCOUNT_SID = Config.TWILIO_ACCOUNT_SID
+_TWILIO_AUTH_TOKEN = Config.TWILIO_AUTH_TOKEN
+# Resend auth header built once instead of per email send.
+_RESEND_HEADERS = {"Authorization": f"Bearer {Config.RESEND_API_KEY}"}
+
+
+@functools.lru_cache(maxsize=1)
+def _twilio_client():
+    """Shared Twilio REST client, built on first use.
+
+    The twilio.rest import pulls in dozens of submodules, so it stays out of
+    module import; after the first call every end-call/timer path reuses one
+    client (and its HTTP session) instead of constructing a new one.
+    """
+    from twilio.rest import Client
+    return Client(_TWILIO_ACCOUNT_SID, _TWILIO_AUTH_TOKEN)
+
+
+# Log separators precomputed once; the string multiply ran on every banner.
+_SEP80 = "=" * 80
+
 # ===== DEMO SESSION TRACKING =====
-demo_sessions = {}
-demo_pending_start = {} # Sessions waiting for key press
+# TTL caches instead of plain dicts: a call that never completes its flow
+# (caller hangs up mid-IVR, webhook never fires) previously leaked its entry
+# forever. Eviction happens lazily on access, so no reaper task is needed.
+# Pending sessions are short-lived (waiting for a key press) and expire in
+# 1 h; active sessions get 24 h.
+demo_sessions = TTLCache(maxsize=10_000, ttl=24 * 3600)
+demo_pending_start = TTLCache(maxsize=10_000, ttl=3600)  # Sessions waiting for key press
+
+# Reverse indexes (call SID -> session ID) maintained alongside the caches
+# above, so Twilio callbacks resolve a session in O(1) instead of scanning.
+# Same TTLs, so index entries age out with the sessions they point at.
+sid_by_call: TTLCache = TTLCache(maxsize=10_000, ttl=24 * 3600)
+pending_sid_by_call: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Case-insensitive mirrors (lowercased session ID -> canonical session ID) so
+# /api/validate-session is a dict lookup instead of lowercasing every key in
+# two full scans per request. Same TTLs as the caches they mirror; a mirror
+# hit whose session has expired just resolves to a miss.
+pending_ci: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+sessions_ci: TTLCache = TTLCache(maxsize=10_000, ttl=24 * 3600)
 
 # ===== DASHBOARD CLIENTS =====
 class DashboardClient:
+    """A connected dashboard with its own bounded send queue.
+
+    One long-lived sender task per client replaces per-event task spawning:
+    delivery stays in-order, a slow client only backs up its own queue, and
+    when the queue is full the oldest frame is dropped so memory stays bounded.
+    """
+
+    SEND_QUEUE_MAX = 512
+
     def __init__(self, websocket: WebSocket, call_sid: Optional[str] = None):
         self.websocket = websocket
         self.call_sid = call_sid
+        self.out_queue: asyncio.Queue = asyncio.Queue(maxsize=self.SEND_QUEUE_MAX)
+        self._sender_task = asyncio.create_task(self._sender())
+
+    async def _sender(self):
+        try:
+            while True:
+                message = await self.out_queue.get()
+                if isinstance(message, bytes):
+                    await self.websocket.send_bytes(message)
+                else:
+                    await self.websocket.send_text(message)
+        except Exception:
+            _unregister_dashboard(self)
+
+    def enqueue(self, message) -> None:
+        """Queue a frame (str or pre-encoded bytes), dropping the oldest when full."""
+        try:
+            self.out_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            try:
+                self.out_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                self.out_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                pass
+
+    def close(self) -> None:
+        if not self._sender_task.done():
+            self._sender_task.cancel()
 
 active_calls: Dict[str, Dict[str, Any]] = {}
-dashboard_clients: Set[DashboardClient] = set()
 
+# Weak references throughout: the strong refs are the stream handler's local
+# and the client's running sender task, so a client that drops without going
+# through the clean removal path is still reclaimed by GC instead of pinning
+# its socket buffers for the life of the process.
+dashboard_clients: WeakSet = WeakSet()
 
-# ===== BROADCAST HELPER =====
-async def _do_broadcast(payload: Dict[str, Any], call_sid: Optional[str] = None):
-    try:
-        if "timestamp" not in payload or payload["timestamp"] is None:
-            payload["timestamp"] = int(time.time() * 1000)
-        else:
-            ts = float(payload["timestamp"])
-            if ts < 32503680000:
-                payload["timestamp"] = int(ts * 1000)
-            else:
-                payload["timestamp"] = int(ts)
-    except Exception:
-        payload["timestamp"] = int(time.time() * 1000)
+# Broadcast fan-out indexes: clients watching every call vs. clients pinned to
+# one call SID. _do_broadcast walks only the relevant buckets instead of
+# filtering the full client set per message.
+global_dashboards: WeakSet = WeakSet()
+per_call_dashboards: Dict[str, WeakSet] = {}
 
-    if call_sid and "callSid" not in payload:
-        payload["callSid"] = call_sid
 
-    text = json.dumps(payload)
-    to_remove = []
-    
-    for client in list(dashboard_clients):
+def _register_dashboard(client: DashboardClient) -> None:
+    dashboard_clients.add(client)
+    if client.call_sid is None:
+        global_dashboards.add(client)
+    else:
+        per_call_dashboards.setdefault(client.call_sid, WeakSet()).add(client)
+
+
+def _unregister_dashboard(client: DashboardClient) -> None:
+    dashboard_clients.discard(client)
+    global_dashboards.discard(client)
+    if client.call_sid is not None:
+        bucket = per_call_dashboards.get(client.call_sid)
+        if bucket is not None:
+            bucket.discard(client)
+            if not bucket:
+                del per_call_dashboards[client.call_sid]
+
+
+# ===== BROADCAST HELPER =====
+# Events are coalesced for ~20ms and shipped as ONE WebSocket frame
+# ({"messageType": "batch", "events": [...]}) per subscriber group, instead of
+# one frame (and one awaited send per client) per event.
+_BROADCAST_FLUSH_INTERVAL = 0.02
+
+# Audio frames arrive at ~50/s per direction and tolerate display latency, so
+# they coalesce over a longer window: ~5-10 mulaw chunks per WebSocket frame
+# instead of one frame per chunk. Non-audio events keep the 20ms tick.
+_AUDIO_FLUSH_INTERVAL = 0.1
+
+# Keepalive frame is constant; encode it once instead of per ping.
+_PING_BYTES = orjson.dumps({"type": "ping"})
+
+# pybase64 encodes/decodes with SIMD kernels; used on the outbound
+# audio-coalescing path. Stdlib fallback keeps deploys portable.
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# Outbound Twilio frames are coalesced: decoded mulaw bytes accumulate and
+# flush at ~80ms of audio, or 40ms after the last delta for partial buffers.
+# That cuts WebSocket sends (asyncio -> kernel round trips) 3-4x per call;
+# Twilio buffers ~200ms, so the added latency stays inside its jitter budget.
+_OUT_FLUSH_BYTES = 640   # 80ms of 8kHz mulaw
+_OUT_FLUSH_DELAY = 0.04
+
+# Constant per-event log lines keyed by type: one dict hit replaces the
+# string elif chain that ran on every non-audio OpenAI event.
+_EVENT_INFO_LOGS = {
+    'session.created': "✅ [OpenAI] Session created successfully",
+    'session.updated': "✅ [OpenAI] Session updated successfully",
+}
+_EVENT_DEBUG_LOGS = {
+    'response.audio_transcript.delta': "[OpenAI] 📝 AI transcript delta received",
+    'response.audio_transcript.done': "[OpenAI] ✅ AI transcript complete",
+    'conversation.item.input_audio_transcription.completed': "[OpenAI] 📝 Caller transcript received",
+    'response.done': "[OpenAI] ✅ Response complete",
+}
+
+# Constant OpenAI control messages, serialized once. OpenAI expects text
+# frames, so these stay str (sent via send_raw_to_openai).
+_MSG_RESPONSE_CANCEL = '{"type":"response.cancel"}'
+_MSG_BUFFER_CLEAR = '{"type":"input_audio_buffer.clear"}'
+_MSG_BUFFER_COMMIT = '{"type":"input_audio_buffer.commit"}'
+
+_broadcast_pending: list = []  # (payload, call_sid) tuples awaiting the next flush
+_audio_pending: list = []  # audio frames, flushed on the slower audio cadence
+_broadcast_event = asyncio.Event()
+_broadcast_flusher_task: Optional[asyncio.Task] = None
+
+
+# Epoch values above this are already in milliseconds (year 3000 in seconds).
+_MS_EPOCH_THRESHOLD = 32503680000
+
+
+def _normalize_timestamp(payload: Dict[str, Any]) -> None:
+    # Fast paths first: absent/None and already-in-ms ints cover nearly every
+    # event, and time.time_ns()//1_000_000 yields an int directly with no
+    # float detour. Malformed values fall through to the except arm.
+    ts = payload.get("timestamp")
+    if ts is None:
+        payload["timestamp"] = time.time_ns() // 1_000_000
+    elif isinstance(ts, int):
+        if ts < _MS_EPOCH_THRESHOLD:
+            payload["timestamp"] = ts * 1000
+    else:
         try:
-            should_send = (
-                client.call_sid is None or
-                client.call_sid == call_sid
-            )
-            if should_send:
-                await client.websocket.send_text(text)
-        except Exception as e:
-            Log.debug(f"Failed to send to client: {e}")
-            to_remove.append(client)
-    
-    for c in to_remove:
-        dashboard_clients.discard(c)
+            ts = float(ts)
+            payload["timestamp"] = int(ts * 1000) if ts < _MS_EPOCH_THRESHOLD else int(ts)
+        except Exception:
+            payload["timestamp"] = time.time_ns() // 1_000_000
+
+
+# With per-client queues each enqueue is just a put_nowait, but a very large
+# client list is still one uninterrupted Python loop on the event loop; yield
+# between chunks so media handling never waits behind a full fan-out pass.
+_BROADCAST_CHUNK = 50
+
+
+async def _do_broadcast(events: list, call_sid: Optional[str] = None):
+    # One C-level serialization to a UTF-8 bytes buffer, shared by every
+    # client send; no per-client str->bytes encode inside the websocket layer.
+    data = orjson.dumps({"messageType": "batch", "events": events})
+
+    # Only the buckets that can match: every global client, plus clients
+    # pinned to this call. No per-client call_sid comparison needed.
+    targets = list(global_dashboards)
+    if call_sid is not None:
+        subscribers = per_call_dashboards.get(call_sid)
+        if subscribers:
+            targets.extend(subscribers)
+
+    for i in range(0, len(targets), _BROADCAST_CHUNK):
+        if i:
+            await asyncio.sleep(0)
+        for client in targets[i:i + _BROADCAST_CHUNK]:
+            client.enqueue(data)
+
+
+async def _broadcast_flusher():
+    """Drain pending dashboard events once per tick, grouped by call SID.
+
+    Audio frames ride the same batch format but are only folded in once per
+    _AUDIO_FLUSH_INTERVAL, so they accumulate into bigger batches.
+    """
+    loop = asyncio.get_running_loop()
+    last_audio_flush = loop.time()
+    while True:
+        await _broadcast_event.wait()
+        await asyncio.sleep(_BROADCAST_FLUSH_INTERVAL)
+
+        pending = _broadcast_pending[:]
+        _broadcast_pending.clear()
+
+        if _audio_pending:
+            now = loop.time()
+            if now - last_audio_flush >= _AUDIO_FLUSH_INTERVAL:
+                pending.extend(_audio_pending)
+                _audio_pending.clear()
+                last_audio_flush = now
+
+        # Keep ticking while audio is still waiting out its window.
+        if not _audio_pending:
+            _broadcast_event.clear()
+
+        groups: Dict[Optional[str], list] = {}
+        for payload, call_sid in pending:
+            groups.setdefault(call_sid, []).append(payload)
+
+        for call_sid, events in groups.items():
+            try:
+                await _do_broadcast(events, call_sid)
+            except Exception as e:
+                Log.error(f"[Broadcast] Flush failed: {e}")
+
+
+def _has_dashboards(call_sid: Optional[str] = None) -> bool:
+    """Cheap check for any subscriber that could receive a broadcast.
+
+    Lets hot paths skip building the payload dict entirely when nobody
+    is watching.
+    """
+    if global_dashboards:
+        return True
+    if call_sid is not None:
+        bucket = per_call_dashboards.get(call_sid)
+        return bool(bucket)
+    return False
 
 
 def broadcast_to_dashboards_nonblocking(payload: Dict[str, Any], call_sid: Optional[str] = None):
+    global _broadcast_flusher_task
+    if not _has_dashboards(call_sid):
+        return
     try:
-        asyncio.create_task(_do_broadcast(payload, call_sid))
+        _normalize_timestamp(payload)
+        if call_sid and "callSid" not in payload:
+            payload["callSid"] = call_sid
+
+        if payload.get("messageType") == "audio":
+            _audio_pending.append((payload, call_sid))
+        else:
+            _broadcast_pending.append((payload, call_sid))
+        _broadcast_event.set()
+
+        if _broadcast_flusher_task is None or _broadcast_flusher_task.done():
+            _broadcast_flusher_task = asyncio.create_task(_broadcast_flusher())
     except Exception as e:
-        Log.error(f"[Broadcast] Failed to create broadcast task: {e}")
+        Log.error(f"[Broadcast] Failed to queue broadcast: {e}")
 
 
 # ===== EMAIL HELPER =====
-def send_call_summary_email(call_sid: str, session_id: str = None, phone: str = 'Unknown', duration_seconds: int = None, rating: int = None, ended_early: bool = False):
+# The HTML layout is parsed once into a string.Template at import; each send
+# is then a single substitute() call instead of re-building the 40-line body
+# through nested f-strings.
+_EMAIL_TPL = Template("""
+        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+            <h2 style="color: #2c3e50;">$heading</h2>
+
+            <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
+                $feedback_html
+                <p><strong>📱 Phone:</strong> $phone</p>
+                <p><strong>🆔 Call SID:</strong> <code style="background: #e9ecef; padding: 2px 6px; border-radius: 3px;">$call_sid</code></p>
+                <p><strong>🔑 Session ID:</strong> $session_id</p>
+                <p><strong>⏱️ Duration:</strong> $duration_str</p>
+                <p><strong>🕐 Time:</strong> $timestamp</p>
+            </div>
+
+            $dashboard_link
+
+            <hr style="border: none; border-top: 1px solid #dee2e6; margin: 30px 0;">
+
+            <p style="color: #6c757d; font-size: 12px; text-align: center;">
+                <strong>Finlumina VOX Demo System</strong><br>
+                Status: $feedback_status
+            </p>
+        </div>
+        """)
+
+_DASHBOARD_LINK_TPL = Template(
+    '<p style="text-align: center; margin: 20px 0;"><a href="https://vox.finlumina.com/demo/$session_id" '
+    'style="background: #3498db; color: white; padding: 12px 24px; text-decoration: none; '
+    'border-radius: 5px; display: inline-block;">📊 View Dashboard</a></p>'
+)
+
+# Per-call dedupe: /call-status (early hangup), /demo-rating, and the
+# media-stream cleanup can race and each try to email the same call. Early
+# hangup and end-of-demo summaries share the 'summary' kind so a call gets at
+# most one of those plus at most one rating email. TTL-bounded so old call
+# SIDs age out.
+_email_sent: TTLCache = TTLCache(maxsize=10_000, ttl=24 * 3600)
+
+# Emails go through a module-level queue drained by one worker coroutine, so
+# handlers never wait on Resend's API and sends are serialized against its
+# rate cap.
+_email_queue: asyncio.Queue = asyncio.Queue()
+_email_worker_task: Optional[asyncio.Task] = None
+
+
+async def _email_worker():
+    """Drain queued email jobs one at a time."""
+    while True:
+        kwargs = await _email_queue.get()
+        try:
+            await send_call_summary_email(**kwargs)
+        except Exception as e:
+            Log.error(f"📧 Email worker failed: {e}")
+        finally:
+            _email_queue.task_done()
+
+
+def queue_call_summary_email(**kwargs) -> None:
+    """Fire-and-forget: enqueue a call summary email without blocking the caller."""
+    global _email_worker_task
+    _email_queue.put_nowait(kwargs)
+    if _email_worker_task is None or _email_worker_task.done():
+        _email_worker_task = asyncio.create_task(_email_worker())
+
+
+async def send_call_summary_email(call_sid: str, session_id: str = None, phone: str = 'Unknown', duration_seconds: int = None, rating: int = None, ended_early: bool = False):
     """Send call summary email (with or without rating)."""
-    Log.info("=" * 80)
-    Log.info("📧 SEND_CALL_SUMMARY_EMAIL CALLED")
-    Log.info("=" * 80)
-    Log.info(f"  call_sid: {call_sid}")
-    Log.info(f"  session_id: {session_id}")
-    Log.info(f"  phone: {phone}")
-    Log.info(f"  duration_seconds: {duration_seconds}")
-    Log.info(f"  rating: {rating}")
-    Log.info(f"  ended_early: {ended_early}")
+    # Single level check gates the whole banner: the f-strings below are
+    # built by the caller even when Log.info would drop them.
+    if Log.info_enabled():
+        Log.info(_SEP80)
+        Log.info("📧 SEND_CALL_SUMMARY_EMAIL CALLED")
+        Log.info(_SEP80)
+        Log.info(f"  call_sid: {call_sid}")
+        Log.info(f"  session_id: {session_id}")
+        Log.info(f"  phone: {phone}")
+        Log.info(f"  duration_seconds: {duration_seconds}")
+        Log.info(f"  rating: {rating}")
+        Log.info(f"  ended_early: {ended_early}")
     
+    # Dedupe before any work: the single worker coroutine runs sends one at a
+    # time, so check-then-mark here is race-free.
+    dedupe_key = (call_sid, 'rating' if rating else 'summary')
+    if dedupe_key in _email_sent:
+        Log.info(f"📧 Email already sent for {dedupe_key} - skipping duplicate")
+        return
+    _email_sent[dedupe_key] = True
+
     try:
-        if not Config.has_email_configured():
+        if not HAS_EMAIL:
             Log.warning("📧 Resend not configured - skipping email")
-            Log.warning(f"  RESEND_API_KEY present: {bool(Config.RESEND_API_KEY)}")
             return
         
         Log.info("✅ Email is configured - proceeding...")
-        
-        import resend
-        resend.api_key = Config.RESEND_API_KEY
-        
-        Log.info(f"✅ Resend API key set: {Config.RESEND_API_KEY[:10]}...")
-        
+
         # Build subject
         if rating:
             subject = f"VOX Demo Rating: {rating}/5 {'⭐' * rating}"
@@ -142,45 +476,45 @@ def send_call_summary_email(call_sid: str, session_id: str = None, phone: str =
             feedback_html = '<p><strong>ℹ️ Feedback:</strong> Call completed without rating</p>'
             feedback_status = "No rating collected"
         
-        # Build HTML body
-        html_body = f"""
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <h2 style="color: #2c3e50;">{'🎉 New VOX Demo Feedback!' if rating else '📞 VOX Demo Call Summary'}</h2>
-            
-            <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                {feedback_html}
-                <p><strong>📱 Phone:</strong> {phone}</p>
-                <p><strong>🆔 Call SID:</strong> <code style="background: #e9ecef; padding: 2px 6px; border-radius: 3px;">{call_sid}</code></p>
-                <p><strong>🔑 Session ID:</strong> {session_id or 'N/A'}</p>
-                <p><strong>⏱️ Duration:</strong> {duration_str}</p>
-                <p><strong>🕐 Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-            
-            {f'<p style="text-align: center; margin: 20px 0;"><a href="https://vox.finlumina.com/demo/{session_id}" style="background: #3498db; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block;">📊 View Dashboard</a></p>' if session_id else ''}
-            
-            <hr style="border: none; border-top: 1px solid #dee2e6; margin: 30px 0;">
-            
-            <p style="color: #6c757d; font-size: 12px; text-align: center;">
-                <strong>Finlumina VOX Demo System</strong><br>
-                Status: {feedback_status}
-            </p>
-        </div>
-        """
+        # Build HTML body from the pre-compiled template; the conditional
+        # pieces are resolved here so the template expansion stays branch-free.
+        html_body = _EMAIL_TPL.substitute(
+            heading='🎉 New VOX Demo Feedback!' if rating else '📞 VOX Demo Call Summary',
+            feedback_html=feedback_html,
+            phone=phone,
+            call_sid=call_sid,
+            session_id=session_id or 'N/A',
+            duration_str=duration_str,
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            dashboard_link=_DASHBOARD_LINK_TPL.substitute(session_id=session_id) if session_id else '',
+            feedback_status=feedback_status,
+        )
         
         params = {
             "from": "VOX Demo <onboarding@resend.dev>",
-            "to": [Config.FEEDBACK_EMAIL],
+            "to": [_FEEDBACK_EMAIL],
             "subject": subject,
             "html": html_body,
         }
         
-        Log.info(f"📧 Sending email to: {Config.FEEDBACK_EMAIL}")
+        Log.info(f"📧 Sending email to: {_FEEDBACK_EMAIL}")
         Log.info(f"📧 Email params: from={params['from']}, to={params['to']}, subject={params['subject']}")
-        
-        result = resend.Emails.send(params)
-        
+
+        # POST straight to Resend's HTTP API over the shared session; the SDK
+        # call it replaces was a blocking requests.post that stalled the loop.
+        session = http_client.get_session()
+        async with session.post(
+            "https://api.resend.com/emails",
+            headers=_RESEND_HEADERS,
+            json=params,
+        ) as resp:
+            result = await resp.text()
+            if resp.status >= 400:
+                Log.error(f"📧 Resend API error {resp.status}: {result}")
+                return
+
         Log.info(f"✅ Resend API response: {result}")
-        Log.info(f"✅ Call summary email sent to {Config.FEEDBACK_EMAIL} ({feedback_status})")
+        Log.info(f"✅ Call summary email sent to {_FEEDBACK_EMAIL} ({feedback_status})")
         
     except Exception as e:
         Log.error(f"📧 Could not send call summary email: {e}")
@@ -200,6 +534,27 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def validate_config():
+    """Fail fast at server startup if required config is missing."""
+    Config.validate_required_config()
+
+
+@app.on_event("shutdown")
+async def close_http_session():
+    """Flush queued emails, then close the shared outbound HTTP session."""
+    if _email_worker_task is not None and not _email_worker_task.done():
+        try:
+            # Give in-flight summary emails a bounded window to land before
+            # the worker (and the session it sends through) goes away.
+            async with asyncio.timeout(5.0):
+                await _email_queue.join()
+        except TimeoutError:
+            Log.warning("[Shutdown] Email queue not drained within 5s")
+        _email_worker_task.cancel()
+    await http_client.close_session()
+
+
 # ===== ENDPOINTS =====
 @app.get("/", response_class=JSONResponse)
 async def index_page():
@@ -225,7 +580,10 @@ async def handle_incoming_call(request: Request):
             'created_at': time.time(),
             'restaurant_id': restaurant_id
         }
-        
+        pending_ci[session_id.lower()] = session_id
+        if call_sid:
+            pending_sid_by_call[call_sid] = session_id
+
         Log.info(f"📞 Incoming call: {call_sid} for restaurant: {restaurant_id}")
         Log.info(f"🎯 Session ID: {session_id}")
         Log.info(f"📊 Dashboard: https://vox.finlumina.com/demo/{session_id}")
@@ -233,24 +591,13 @@ async def handle_incoming_call(request: Request):
         # Build backend URL
         backend_url = f"https://{request.url.hostname}"
         
-        # 🔥 Create response with status callback
-        from twilio.twiml.voice_response import VoiceResponse as TwilioVoiceResponse
-        
-        response = TwilioVoiceResponse()
-        
-        # 🔥 Set status callback to track hangups
-        status_callback_url = f"{backend_url}/call-status"
-        
-        # Get intro TwiML
-        intro_twiml_str = TwilioService.create_demo_intro_twiml(session_id, backend_url)
-        
-        # Parse and merge TwiML with status callback
-        # We need to add statusCallback to the root Response element
-        intro_twiml_str = intro_twiml_str.replace(
-            '<Response>',
-            f'<Response statusCallback="{status_callback_url}" statusCallbackMethod="POST" statusCallbackEvent="completed failed">'
+        # 🔥 Status callback (hangup tracking) is rendered directly on the
+        # root <Response>, so no post-hoc string surgery on the XML.
+        intro_twiml_str = TwilioService.create_demo_intro_twiml(
+            session_id, backend_url,
+            status_callback_url=f"{backend_url}/call-status"
         )
-        
+
         return Response(content=intro_twiml_str, media_type="application/xml")
         
     except Exception as e:
@@ -258,8 +605,7 @@ async def handle_incoming_call(request: Request):
         import traceback
         Log.error(f"Traceback: {traceback.format_exc()}")
         
-        from twilio.twiml.voice_response import VoiceResponse as TwilioVoiceResponse
-        response = TwilioVoiceResponse()
+        response = VoiceResponse()
         response.say("Error starting demo. Please try again.", voice=TwilioService.TWILIO_VOICE)
         return Response(content=str(response), media_type="application/xml")
 
@@ -281,16 +627,16 @@ async def handle_demo_start(request: Request):
         
         Log.info(f"🎬 Demo start requested for {call_sid} (pressed: {digits}, skipped: {skipped})")
         
-        session_id = None
-        for sid, data in demo_pending_start.items():
-            if data['call_sid'] == call_sid:
-                session_id = sid
-                break
-        
-        if session_id:
-            demo_sessions[session_id] = demo_pending_start.pop(session_id)
+        session_id = pending_sid_by_call.pop(call_sid, None)
+        session_data = demo_pending_start.pop(session_id, None) if session_id else None
+
+        if session_data is not None:
+            demo_sessions[session_id] = session_data
             demo_sessions[session_id]['started_at'] = time.time()
             demo_sessions[session_id]['demo_active'] = True
+            sid_by_call[call_sid] = session_id
+            pending_ci.pop(session_id.lower(), None)
+            sessions_ci[session_id.lower()] = session_id
             Log.info(f"✅ Demo activated for session: {session_id} (restaurant: {demo_sessions[session_id].get('restaurant_id')})")
         
         backend_host = request.url.hostname
@@ -328,13 +674,8 @@ async def demo_rating(request: Request):
             return Response(content=twiml, media_type="application/xml")
         
         # Find session for this call
-        session_id = None
-        session_data = None
-        for sid, data in demo_sessions.items():
-            if data.get('call_sid') == call_sid:
-                session_id = sid
-                session_data = data
-                break
+        session_id = sid_by_call.get(call_sid)
+        session_data = demo_sessions.get(session_id) if session_id else None
         
         # Calculate duration
         duration = None
@@ -342,7 +683,7 @@ async def demo_rating(request: Request):
             duration = int(time.time() - session_data['started_at'])
         
         # 🔥 Send email with rating (NOT ended_early)
-        send_call_summary_email(
+        queue_call_summary_email(
             call_sid=call_sid,
             session_id=session_id,
             phone=from_phone,
@@ -357,8 +698,7 @@ async def demo_rating(request: Request):
         
     except Exception as e:
         Log.error(f"Rating handler error: {e}")
-        from twilio.twiml.voice_response import VoiceResponse as TwilioVoiceResponse
-        response = TwilioVoiceResponse()
+        response = VoiceResponse()
         response.say("Thank you. Goodbye!", voice=TwilioService.TWILIO_VOICE)
         response.hangup()
         return Response(content=str(response), media_type="application/xml")
@@ -367,14 +707,15 @@ async def demo_rating(request: Request):
 async def handle_call_status(request: Request):
     """Handle Twilio call status callbacks (hangup tracking)."""
     try:
-        Log.info("=" * 80)
+        Log.info(_SEP80)
         Log.info("🔥 CALL STATUS CALLBACK RECEIVED")
-        Log.info("=" * 80)
+        Log.info(_SEP80)
         
         form_data = await request.form()
-        
-        # Log ALL form data
-        Log.info(f"📋 All form data: {dict(form_data)}")
+
+        # Log ALL form data (dict() allocation only happens when the level is on)
+        if Log.debug_enabled():
+            Log.debug(f"📋 All form data: {dict(form_data)}")
         
         call_sid = form_data.get('CallSid')
         call_status = form_data.get('CallStatus')
@@ -393,26 +734,20 @@ async def handle_call_status(request: Request):
             # Find session for this call
             session_id = None
             phone = from_phone
-            
+
             # Check active sessions first
-            Log.info(f"🔍 Checking active sessions: {list(demo_sessions.keys())}")
-            for sid, data in demo_sessions.items():
-                if data.get('call_sid') == call_sid:
-                    session_id = sid
-                    phone = data.get('phone', from_phone)
-                    Log.info(f"✅ Found in active sessions: {session_id}")
-                    break
-            
+            session_id = sid_by_call.get(call_sid)
+            if session_id:
+                phone = demo_sessions.get(session_id, {}).get('phone', from_phone)
+                Log.info(f"✅ Found in active sessions: {session_id}")
+
             # Check pending sessions (hung up before pressing key)
             if not session_id:
-                Log.info(f"🔍 Checking pending sessions: {list(demo_pending_start.keys())}")
-                for sid, data in demo_pending_start.items():
-                    if data.get('call_sid') == call_sid:
-                        session_id = sid
-                        phone = data.get('phone', from_phone)
-                        Log.info(f"✅ Found in pending sessions: {session_id}")
-                        break
-            
+                session_id = pending_sid_by_call.get(call_sid)
+                if session_id:
+                    phone = demo_pending_start.get(session_id, {}).get('phone', from_phone)
+                    Log.info(f"✅ Found in pending sessions: {session_id}")
+
             if not session_id:
                 Log.warning(f"⚠️ Session not found for call {call_sid}")
             
@@ -427,7 +762,7 @@ async def handle_call_status(request: Request):
             # 🔥 Only send if call was very short (< 55 seconds = ended before demo timer)
             if duration_int < 55:
                 Log.info(f"📧 Call duration < 55s - sending early hangup email...")
-                send_call_summary_email(
+                queue_call_summary_email(
                     call_sid=call_sid,
                     session_id=session_id,
                     phone=phone,
@@ -435,13 +770,13 @@ async def handle_call_status(request: Request):
                     rating=None,
                     ended_early=True  # 🔥 Flag as early hangup
                 )
-                Log.info(f"✅ Email sent for early hangup: {call_sid} ({duration_int}s)")
+                Log.info(f"✅ Email queued for early hangup: {call_sid} ({duration_int}s)")
             else:
                 Log.info(f"ℹ️ Call duration >= 55s - skipping email (will be sent by /media-stream cleanup)")
         else:
             Log.info(f"ℹ️ Status '{call_status}' not in target list - skipping")
         
-        Log.info("=" * 80)
+        Log.info(_SEP80)
         return Response(content="OK", status_code=200)
         
     except Exception as e:
@@ -458,31 +793,35 @@ async def validate_session(session_id: str):
         Log.info(f"🔍 Validating session: {session_id}")
         
         session_id_lower = session_id.lower()
-        
-        for sid, data in demo_pending_start.items():
-            if sid.lower() == session_id_lower:
-                Log.info(f"✅ Found pending session: {sid}")
-                return JSONResponse({
-                    "valid": True,
-                    "status": "pending",
-                    "sessionId": sid,
-                    "callSid": data.get('call_sid'),
-                    "restaurantId": data.get('restaurant_id', 'demo'),
-                    "createdAt": data.get('created_at')
-                })
-        
-        for sid, data in demo_sessions.items():
-            if sid.lower() == session_id_lower:
-                Log.info(f"✅ Found active session: {sid}")
-                return JSONResponse({
-                    "valid": True,
-                    "status": "active",
-                    "sessionId": sid,
-                    "callSid": data.get('call_sid'),
-                    "restaurantId": data.get('restaurant_id', 'demo'),
-                    "startedAt": data.get('started_at')
-                })
-        
+
+        # O(1) lookups through the case-insensitive mirrors; a mirror hit
+        # whose backing session has expired falls through to "not found".
+        sid = pending_ci.get(session_id_lower)
+        data = demo_pending_start.get(sid) if sid else None
+        if data is not None:
+            Log.info(f"✅ Found pending session: {sid}")
+            return JSONResponse({
+                "valid": True,
+                "status": "pending",
+                "sessionId": sid,
+                "callSid": data.get('call_sid'),
+                "restaurantId": data.get('restaurant_id', 'demo'),
+                "createdAt": data.get('created_at')
+            })
+
+        sid = sessions_ci.get(session_id_lower)
+        data = demo_sessions.get(sid) if sid else None
+        if data is not None:
+            Log.info(f"✅ Found active session: {sid}")
+            return JSONResponse({
+                "valid": True,
+                "status": "active",
+                "sessionId": sid,
+                "callSid": data.get('call_sid'),
+                "restaurantId": data.get('restaurant_id', 'demo'),
+                "startedAt": data.get('started_at')
+            })
+
         Log.warning(f"⚠️ Session not found: {session_id}")
         Log.info(f"📋 Available pending sessions: {list(demo_pending_start.keys())}")
         Log.info(f"📋 Available active sessions: {list(demo_sessions.keys())}")
@@ -514,7 +853,7 @@ async def dashboard_stream(websocket: WebSocket):
 
     try:
         msg = await asyncio.wait_for(websocket.receive_text(), timeout=5)
-        data = json.loads(msg)
+        data = orjson.loads(msg)
         client_call_id = data.get("callId")
         client_session_id = data.get("sessionId")
         
@@ -533,12 +872,12 @@ async def dashboard_stream(websocket: WebSocket):
         else:
             Log.info("Dashboard client subscribed to ALL calls")
             
-    except (asyncio.TimeoutError, json.JSONDecodeError, KeyError):
+    except (asyncio.TimeoutError, orjson.JSONDecodeError, KeyError):
         Log.info("Dashboard client subscribed to ALL calls")
         client_call_id = None
 
     client = DashboardClient(websocket, client_call_id)
-    dashboard_clients.add(client)
+    _register_dashboard(client)
     Log.info(f"Dashboard connected. Total clients: {len(dashboard_clients)}")
     
     try:
@@ -547,13 +886,14 @@ async def dashboard_stream(websocket: WebSocket):
                 await asyncio.wait_for(websocket.receive_text(), timeout=20.0)
             except asyncio.TimeoutError:
                 try:
-                    await websocket.send_text(json.dumps({"type": "ping"}))
+                    client.enqueue(_PING_BYTES)
                 except Exception:
                     break
     except WebSocketDisconnect:
         pass
     finally:
-        dashboard_clients.discard(client)
+        client.close()
+        _unregister_dashboard(client)
         Log.info(f"Dashboard disconnected. Total clients: {len(dashboard_clients)}")
         
 
@@ -581,22 +921,17 @@ async def human_audio_stream(websocket: WebSocket, call_sid: str):
     try:
         while True:
             message = await websocket.receive_text()
-            data = json.loads(message)
+            data = orjson.loads(message)
             
             if data.get("type") == "audio":
                 audio_base64 = data.get("audio")
                 
                 if audio_base64 and openai_service.is_human_in_control():
-                    stream_sid = getattr(connection_manager.state, 'stream_sid', None)
-                    if stream_sid:
-                        twilio_message = {
-                            "event": "media",
-                            "streamSid": stream_sid,
-                            "media": {
-                                "payload": audio_base64
-                            }
-                        }
-                        await connection_manager.send_to_twilio(twilio_message)
+                    # state always defines stream_sid (None until the start
+                    # event), so a plain attribute read beats getattr-with-
+                    # default on this per-frame path.
+                    if connection_manager.state.stream_sid:
+                        await connection_manager.send_media_payload_to_twilio(audio_base64)
                     
                     await openai_service.send_human_audio_to_openai(
                         audio_base64,
@@ -615,9 +950,7 @@ async def human_audio_stream(websocket: WebSocket, call_sid: str):
             openai_service.disable_human_takeover()
             
             try:
-                await connection_manager.send_to_openai({
-                    "type": "input_audio_buffer.clear"
-                })
+                await connection_manager.send_raw_to_openai(_MSG_BUFFER_CLEAR)
             except Exception:
                 pass
             
@@ -628,6 +961,40 @@ async def human_audio_stream(websocket: WebSocket, call_sid: str):
             }, call_sid)
 
 
+# Restaurant-id pairs (requested, stored) that are allowed to differ.
+# 🔥 'demo' may act on calls stored under 'default'.
+_RESTAURANT_ALIASES = {("demo", "default")}
+
+
+def _restaurant_matches(requested: Optional[str], stored: str) -> bool:
+    """Check whether the requested restaurant id may act on the call."""
+    if not requested or requested == stored:
+        return True
+    return (requested, stored) in _RESTAURANT_ALIASES
+
+
+def _resolve_call(call_sid: str, restaurant_id: Optional[str], log_tag: str):
+    """Look up an active call and verify its restaurant id in one place.
+
+    Returns (call_data, None) on success, or (None, JSONResponse) when the
+    call is unknown or the restaurant id does not match. Binds the per-call
+    dict once so handlers read locals instead of repeating active_calls
+    lookups and .get() chains.
+    """
+    call_data = active_calls.get(call_sid)
+    if call_data is None:
+        Log.error(f"[{log_tag}] Call {call_sid} not found in active_calls")
+        Log.error(f"[{log_tag}] Available calls: {list(active_calls.keys())}")
+        return None, JSONResponse({"error": "Call not found"}, status_code=404)
+
+    stored_restaurant_id = call_data.get("restaurant_id", "default")
+    if not _restaurant_matches(restaurant_id, stored_restaurant_id):
+        Log.error(f"[{log_tag}] Restaurant ID mismatch: expected {stored_restaurant_id}, got {restaurant_id}")
+        return None, JSONResponse({"error": "Restaurant ID mismatch"}, status_code=403)
+
+    return call_data, None
+
+
 @app.api_route("/takeover", methods=["POST"])
 async def handle_takeover(request: Request):
     try:
@@ -641,20 +1008,10 @@ async def handle_takeover(request: Request):
         if not call_sid or action not in ["enable", "disable"]:
             return JSONResponse({"error": "Invalid request"}, status_code=400)
         
-        if call_sid not in active_calls:
-            Log.error(f"[Takeover] Call {call_sid} not found in active_calls")
-            Log.error(f"[Takeover] Available calls: {list(active_calls.keys())}")
-            return JSONResponse({"error": "Call not found"}, status_code=404)
-        
-        call_data = active_calls[call_sid]
-        stored_restaurant_id = call_data.get("restaurant_id", "default")
-        
-        # 🔥 FIX: Allow 'demo' to match 'default' for demo calls
-        if restaurant_id and restaurant_id != stored_restaurant_id:
-            if not (restaurant_id == "demo" and stored_restaurant_id == "default"):
-                Log.error(f"[Takeover] Restaurant ID mismatch: expected {stored_restaurant_id}, got {restaurant_id}")
-                return JSONResponse({"error": "Restaurant ID mismatch"}, status_code=403)
-        
+        call_data, error_response = _resolve_call(call_sid, restaurant_id, "Takeover")
+        if error_response:
+            return error_response
+
         openai_service = call_data.get("openai_service")
         connection_manager = call_data.get("connection_manager")
         
@@ -665,17 +1022,13 @@ async def handle_takeover(request: Request):
             openai_service.enable_human_takeover()
             
             try:
-                await connection_manager.send_to_openai({
-                    "type": "response.cancel"
-                })
+                await connection_manager.send_raw_to_openai(_MSG_RESPONSE_CANCEL)
                 Log.info(f"[Takeover] Cancelled AI response")
             except Exception:
                 Log.debug(f"[Takeover] No active response to cancel (normal)")
             
             try:
-                await connection_manager.send_to_openai({
-                    "type": "input_audio_buffer.clear"
-                })
+                await connection_manager.send_raw_to_openai(_MSG_BUFFER_CLEAR)
             except Exception:
                 pass
             
@@ -692,25 +1045,19 @@ async def handle_takeover(request: Request):
             openai_service.disable_human_takeover()
             
             try:
-                await connection_manager.send_to_openai({
-                    "type": "response.cancel"
-                })
+                await connection_manager.send_raw_to_openai(_MSG_RESPONSE_CANCEL)
             except Exception:
                 pass
             
             try:
-                await connection_manager.send_to_openai({
-                    "type": "input_audio_buffer.clear"
-                })
+                await connection_manager.send_raw_to_openai(_MSG_BUFFER_CLEAR)
             except Exception:
                 pass
             
             await asyncio.sleep(0.3)
             
             try:
-                await connection_manager.send_to_openai({
-                    "type": "input_audio_buffer.commit"
-                })
+                await connection_manager.send_raw_to_openai(_MSG_BUFFER_COMMIT)
             except Exception:
                 pass
             
@@ -741,36 +1088,32 @@ async def handle_end_call(request: Request):
         if not call_sid:
             return JSONResponse({"error": "Invalid request"}, status_code=400)
         
-        if call_sid not in active_calls:
+        call_data = active_calls.get(call_sid)
+        if call_data is None:
             Log.warning(f"[EndCall] Call {call_sid} not in active_calls (might have ended)")
         else:
-            call_data = active_calls[call_sid]
             stored_restaurant_id = call_data.get("restaurant_id", "default")
-            
-            # 🔥 FIX: Allow 'demo' to match 'default' for demo calls
-            if restaurant_id and restaurant_id != stored_restaurant_id:
-                if not (restaurant_id == "demo" and stored_restaurant_id == "default"):
-                    Log.error(f"[EndCall] Restaurant ID mismatch: expected {stored_restaurant_id}, got {restaurant_id}")
-                    return JSONResponse({"error": "Restaurant ID mismatch"}, status_code=403)
-            
+            if not _restaurant_matches(restaurant_id, stored_restaurant_id):
+                Log.error(f"[EndCall] Restaurant ID mismatch: expected {stored_restaurant_id}, got {restaurant_id}")
+                return JSONResponse({"error": "Restaurant ID mismatch"}, status_code=403)
+
             openai_service = call_data.get("openai_service")
             if openai_service and openai_service.is_human_in_control():
                 openai_service.disable_human_takeover()
         
-        if Config.has_twilio_credentials():
+        if HAS_TWILIO:
             try:
-                from twilio.rest import Client
-                from twilio.base.exceptions import TwilioRestException
-                
-                client = Client(Config.TWILIO_ACCOUNT_SID, Config.TWILIO_AUTH_TOKEN)
-                client.calls(call_sid).update(status='completed')
+                client = _twilio_client()
+                # Synchronous HTTPS call: run in a worker thread so the event
+                # loop keeps pumping audio for other calls during the RTT.
+                await asyncio.to_thread(client.calls(call_sid).update, status='completed')
                 
                 Log.info(f"[EndCall] ✅ Call {call_sid} ended successfully")
                 
                 broadcast_to_dashboards_nonblocking({
                     "messageType": "callEnded",
                     "callSid": call_sid,
-                    "timestamp": int(time.time() * 1000)
+                    "timestamp": time.time_ns() // 1_000_000
                 }, call_sid)
                 
                 return JSONResponse({
@@ -785,7 +1128,7 @@ async def handle_end_call(request: Request):
                     broadcast_to_dashboards_nonblocking({
                         "messageType": "callEnded",
                         "callSid": call_sid,
-                        "timestamp": int(time.time() * 1000)
+                        "timestamp": time.time_ns() // 1_000_000
                     }, call_sid)
                     
                     return JSONResponse({
@@ -813,9 +1156,9 @@ async def handle_end_call(request: Request):
 
 @app.websocket("/media-stream")
 async def handle_media_stream(websocket: WebSocket):
-    Log.header("=" * 80)
+    Log.header(_SEP80)
     Log.header("🔌 NEW MEDIA STREAM CONNECTION")
-    Log.header("=" * 80)
+    Log.header(_SEP80)
     await websocket.accept()
     Log.info("✅ WebSocket accepted")
 
@@ -835,95 +1178,66 @@ async def handle_media_stream(websocket: WebSocket):
     demo_start_time: Optional[float] = None
     demo_ended = False
     
-    ai_audio_queue = asyncio.Queue()
-    ai_stream_task = None
     shutdown_flag = False
     
     ai_currently_speaking = False
     last_speech_started_time = 0
+
+    # Outbound coalescing buffer (see _OUT_FLUSH_BYTES above).
+    out_audio_buffer = bytearray()
+    out_flush_handle: Optional[asyncio.TimerHandle] = None
     
     # 🔥 Event to wait for Twilio connection
     twilio_connected = asyncio.Event()
 
     # 🔥 DEMO TIMER
     async def check_demo_timer():
-        """Check if 60 seconds elapsed since OpenAI started."""
+        """Sleep out the demo window, then end OpenAI and start feedback.
+
+        One sleep for the whole window instead of a 1s polling loop: zero
+        idle wakeups during the demo, and cancellation (call ended early)
+        just exits without side effects.
+        """
         nonlocal demo_ended
-        
+
         if not demo_start_time:
             return
-        
-        while not shutdown_flag and not demo_ended:
-            elapsed = time.time() - demo_start_time
-            
-            if elapsed >= Config.DEMO_DURATION_SECONDS:
-                demo_ended = True
-                Log.info("⏱️ Demo time expired - ending OpenAI, starting feedback")
-                
-                # Close OpenAI connection
-                try:
-                    await connection_manager.close_openai_connection()
-                except Exception as e:
-                    Log.error(f"Failed to close OpenAI: {e}")
-                
-                # Redirect to feedback TwiML
-                if current_call_sid and Config.has_twilio_credentials():
-                    try:
-                        from twilio.rest import Client
-                        client = Client(Config.TWILIO_ACCOUNT_SID, Config.TWILIO_AUTH_TOKEN)
-                        
-                        backend_url = os.getenv('BACKEND_URL', f"https://{websocket.url.hostname}")
-                        feedback_twiml = TwilioService.create_feedback_twiml(backend_url)
-                        
-                        client.calls(current_call_sid).update(twiml=feedback_twiml)
-                        Log.info("✅ Redirected to feedback flow")
-                    except Exception as e:
-                        Log.error(f"Failed to redirect to feedback: {e}")
-                
-                break
-            
-            await asyncio.sleep(1)
 
-    async def ai_audio_streamer():
-        nonlocal ai_currently_speaking
-        Log.info("[AI Streamer] 🎵 Started")
-        
-        while not shutdown_flag:
+        try:
+            remaining = _DEMO_DURATION_SECONDS - (time.time() - demo_start_time)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        except asyncio.CancelledError:
+            return
+
+        if shutdown_flag or demo_ended:
+            return
+
+        demo_ended = True
+        Log.info("⏱️ Demo time expired - ending OpenAI, starting feedback")
+
+        # Close OpenAI connection
+        try:
+            await connection_manager.close_openai_connection()
+        except Exception as e:
+            Log.error(f"Failed to close OpenAI: {e}")
+
+        # Redirect to feedback TwiML
+        if current_call_sid and HAS_TWILIO:
             try:
-                audio_data = await ai_audio_queue.get()
-                
-                if audio_data is None:
-                    break
-                
-                audio_b64 = audio_data.get("audio", "")
-                try:
-                    audio_bytes = base64.b64decode(audio_b64)
-                    duration_seconds = len(audio_bytes) / 8000.0
-                except Exception as e:
-                    duration_seconds = 0.02
-                
-                ai_currently_speaking = True
-                
-                if current_call_sid:
-                    broadcast_to_dashboards_nonblocking({
-                        "messageType": "audio",
-                        "speaker": "AI",
-                        "audio": audio_b64,
-                        "timestamp": audio_data.get("timestamp", int(time.time() * 1000)),
-                        "callSid": current_call_sid,
-                    }, current_call_sid)
-                
-                await asyncio.sleep(duration_seconds)
-                ai_audio_queue.task_done()
-                
+                client = _twilio_client()
+
+                backend_url = os.getenv('BACKEND_URL', f"https://{websocket.url.hostname}")
+                feedback_twiml = TwilioService.create_feedback_twiml(backend_url)
+
+                # Blocking REST call off the loop: the media handlers
+                # for this call keep running while Twilio redirects.
+                await asyncio.to_thread(
+                    client.calls(current_call_sid).update, twiml=feedback_twiml
+                )
+                Log.info("✅ Redirected to feedback flow")
             except Exception as e:
-                Log.error(f"[AI Streamer] Error: {e}")
-                await asyncio.sleep(0.01)
-        
-        Log.info("[AI Streamer] 🛑 Stopped")
-    
-    async def handle_ai_audio(audio_data: Dict[str, Any]):
-        await ai_audio_queue.put(audio_data)
+                Log.error(f"Failed to redirect to feedback: {e}")
 
     async def handle_openai_transcript(transcription_data: Dict[str, Any]):
         if not transcription_data or not isinstance(transcription_data, dict):
@@ -941,7 +1255,7 @@ async def handle_media_stream(websocket: WebSocket):
             "messageType": "transcription",
             "speaker": speaker,
             "text": text,
-            "timestamp": transcription_data.get("timestamp") or int(time.time() * 1000),
+            "timestamp": transcription_data.get("timestamp") or time.time_ns() // 1_000_000,
             "callSid": current_call_sid,
         }
         broadcast_to_dashboards_nonblocking(payload, current_call_sid)
@@ -979,100 +1293,138 @@ async def handle_media_stream(websocket: WebSocket):
 
         Log.info("🎯 Step 3: Waiting for Twilio stream to start...")
 
-        async def handle_media_event(data: dict):
-            if data.get("event") == "media":
-                media = data.get("media") or {}
-                payload_b64 = media.get("payload")
-                if payload_b64:
-                    should_send_to_dashboard = True
-                    
-                    if openai_service.is_human_in_control():
-                        if current_call_sid and current_call_sid in active_calls:
-                            human_ws = active_calls[current_call_sid].get("human_audio_ws")
-                            if human_ws:
-                                try:
-                                    await human_ws.send_text(json.dumps({
-                                        "type": "caller_audio",
-                                        "audio": payload_b64,
-                                        "timestamp": int(time.time() * 1000)
-                                    }))
-                                except Exception as e:
-                                    Log.error(f"[media] Failed to send to human: {e}")
-                        
-                        if should_send_to_dashboard:
-                            broadcast_to_dashboards_nonblocking({
-                                "messageType": "audio",
-                                "speaker": "Caller",
-                                "audio": payload_b64,
-                                "timestamp": int(time.time() * 1000),
-                                "callSid": current_call_sid
-                            }, current_call_sid)
-                    else:
-                        if connection_manager.is_openai_connected():
-                            try:
-                                audio_message = audio_service.process_incoming_audio(data)
-                                if audio_message:
-                                    await connection_manager.send_to_openai(audio_message)
-                                    Log.debug(f"[media] 🎤 Sent caller audio to OpenAI")
-                            except Exception as e:
-                                Log.error(f"[media] failed to send to OpenAI: {e}")
-                        
-                        if should_send_to_dashboard:
-                            broadcast_to_dashboards_nonblocking({
-                                "messageType": "audio",
-                                "speaker": "Caller",
+        async def handle_media_event(payload_b64: str, media_ts: int):
+            # The connection manager already validated this is a media frame
+            # and extracted the two fields we need; no dict to unpack here.
+            # One clock read per frame, reused by every branch below;
+            # at 50 pps the repeated time.time() calls were pure waste.
+            ts_ms = time.time_ns() // 1_000_000
+
+            if openai_service.is_human_in_control():
+                if current_call_sid and current_call_sid in active_calls:
+                    human_ws = active_calls[current_call_sid].get("human_audio_ws")
+                    if human_ws:
+                        try:
+                            await human_ws.send_bytes(orjson.dumps({
+                                "type": "caller_audio",
                                 "audio": payload_b64,
-                                "timestamp": int(time.time() * 1000),
-                                "callSid": current_call_sid
-                            }, current_call_sid)
+                                "timestamp": ts_ms
+                            }))
+                        except Exception as e:
+                            Log.error(f"[media] Failed to send to human: {e}")
+            elif connection_manager.is_openai_connected():
+                try:
+                    audio_message = audio_service.process_incoming_payload(payload_b64, media_ts)
+                    await connection_manager.send_to_openai(audio_message)
+                    Log.debug("[media] 🎤 Sent caller audio to OpenAI")
+                except Exception as e:
+                    Log.error(f"[media] failed to send to OpenAI: {e}")
+
+            # Dashboard frame is identical either way; build it once
+            # instead of once per takeover branch, and not at all when
+            # nobody is subscribed.
+            if _has_dashboards(current_call_sid):
+                broadcast_to_dashboards_nonblocking({
+                    "messageType": "audio",
+                    "speaker": "Caller",
+                    "audio": payload_b64,
+                    "timestamp": ts_ms,
+                    "callSid": current_call_sid
+                }, current_call_sid)
+
+        async def flush_outbound_audio():
+            """Encode and send whatever outbound audio has accumulated."""
+            nonlocal out_flush_handle
+            if out_flush_handle is not None:
+                out_flush_handle.cancel()
+                out_flush_handle = None
+            if not out_audio_buffer:
+                return
+            if not connection_manager.state.stream_sid:
+                out_audio_buffer.clear()
+                return
+            payload = _b64.b64encode(bytes(out_audio_buffer)).decode('ascii')
+            out_audio_buffer.clear()
+            try:
+                await connection_manager.send_media_payload_to_twilio(payload)
+                mark_msg = audio_service.create_mark_message(
+                    connection_manager.state.stream_sid
+                )
+                await connection_manager.send_to_twilio(mark_msg)
+                Log.debug("[audio-delta] 📞 Sent AI audio to Twilio")
+            except Exception as e:
+                Log.error(f"[audio->twilio] flush failed: {e}")
+
+        def schedule_outbound_flush():
+            nonlocal out_flush_handle
+            if out_flush_handle is None:
+                out_flush_handle = asyncio.get_running_loop().call_later(
+                    _OUT_FLUSH_DELAY,
+                    lambda: asyncio.create_task(flush_outbound_audio()),
+                )
 
         async def handle_audio_delta(response: dict):
+            nonlocal ai_currently_speaking
             try:
                 if openai_service.is_human_in_control():
                     return
-                
+
                 audio_data = openai_service.extract_audio_response_data(response) or {}
                 delta = audio_data.get("delta")
-                
+
                 if delta:
-                    Log.debug(f"[audio-delta] 🔊 Received AI audio delta")
-                    should_send_to_dashboard = True
-                    
-                    if getattr(connection_manager.state, "stream_sid", None):
+                    Log.debug("[audio-delta] 🔊 Received AI audio delta")
+
+                    if connection_manager.state.stream_sid:
                         try:
-                            audio_message = audio_service.process_outgoing_audio(
-                                response, connection_manager.state.stream_sid
-                            )
-                            if audio_message:
-                                await connection_manager.send_to_twilio(audio_message)
-                                mark_msg = audio_service.create_mark_message(
-                                    connection_manager.state.stream_sid
-                                )
-                                await connection_manager.send_to_twilio(mark_msg)
-                                Log.debug(f"[audio-delta] 📞 Sent AI audio to Twilio")
+                            # Interruption timing still tracks per item; the
+                            # bytes themselves ride the coalescing buffer.
+                            item_id = response.get('item_id')
+                            if item_id and audio_service.timing_manager.should_item_be_tracked(item_id):
+                                audio_service.timing_manager.start_response_tracking(item_id)
+
+                            out_audio_buffer.extend(_b64.b64decode(delta))
+                            if len(out_audio_buffer) >= _OUT_FLUSH_BYTES:
+                                await flush_outbound_audio()
+                            else:
+                                schedule_outbound_flush()
                         except Exception as e:
                             Log.error(f"[audio->twilio] failed: {e}")
                     
-                    if should_send_to_dashboard:
-                        await handle_ai_audio({
+                    # Broadcast inline: the old queue + streamer-task hop cost
+                    # a producer/consumer wakeup per 20ms chunk for what is now
+                    # a non-blocking enqueue into the batching pipeline.
+                    ai_currently_speaking = True
+                    if current_call_sid and _has_dashboards(current_call_sid):
+                        broadcast_to_dashboards_nonblocking({
+                            "messageType": "audio",
+                            "speaker": "AI",
                             "audio": delta,
-                            "timestamp": int(time.time() * 1000)
-                        })
+                            "timestamp": time.time_ns() // 1_000_000,
+                            "callSid": current_call_sid,
+                        }, current_call_sid)
                         
             except Exception as e:
                 Log.error(f"[audio-delta] failed: {e}")
 
         async def handle_speech_started():
-            nonlocal ai_currently_speaking, last_speech_started_time
-            
+            nonlocal ai_currently_speaking, last_speech_started_time, out_flush_handle
+
             try:
                 if not openai_service.is_human_in_control():
                     Log.info("🛑 [Interruption] USER SPEAKING - cancelling AI")
-                    
+
                     last_speech_started_time = time.time()
-                    
+
+                    # Drop any coalesced-but-unsent AI audio; the caller is
+                    # talking over it.
+                    out_audio_buffer.clear()
+                    if out_flush_handle is not None:
+                        out_flush_handle.cancel()
+                        out_flush_handle = None
+
                     try:
-                        stream_sid = getattr(connection_manager.state, 'stream_sid', None)
+                        stream_sid = connection_manager.state.stream_sid
                         if stream_sid:
                             clear_message = {
                                 "event": "clear",
@@ -1083,21 +1435,10 @@ async def handle_media_stream(websocket: WebSocket):
                         pass
                     
                     try:
-                        await connection_manager.send_to_openai({
-                            "type": "response.cancel"
-                        })
+                        await connection_manager.send_raw_to_openai(_MSG_RESPONSE_CANCEL)
                     except Exception:
                         pass
                     
-                    cleared_count = 0
-                    while not ai_audio_queue.empty():
-                        try:
-                            ai_audio_queue.get_nowait()
-                            ai_audio_queue.task_done()
-                            cleared_count += 1
-                        except:
-                            break
-                    
                     ai_currently_speaking = False
                     
                     await connection_manager.send_mark_to_twilio()
@@ -1109,27 +1450,26 @@ async def handle_media_stream(websocket: WebSocket):
             event_type = response.get('type', '')
             
             # Log every event from OpenAI
-            Log.info(f"[OpenAI Event] {event_type}")
-            
-            if event_type == 'session.created':
-                Log.info("✅ [OpenAI] Session created successfully")
-            elif event_type == 'session.updated':
-                Log.info("✅ [OpenAI] Session updated successfully")
-            elif event_type == 'response.audio_transcript.delta':
-                Log.debug(f"[OpenAI] 📝 AI transcript delta received")
-            elif event_type == 'response.audio_transcript.done':
-                Log.debug(f"[OpenAI] ✅ AI transcript complete")
-            elif event_type == 'conversation.item.input_audio_transcription.completed':
-                Log.debug(f"[OpenAI] 📝 Caller transcript received")
-            elif event_type == 'response.done':
-                Log.debug(f"[OpenAI] ✅ Response complete")
-            elif event_type == 'error':
-                Log.error(f"[OpenAI] ❌ Error event: {response}")
+            Log.info("[OpenAI Event] %s", event_type)
             
-            openai_service.process_event_for_logging(response)
-            await openai_service.extract_caller_transcript(response)
-            
-            if not openai_service.is_human_in_control():
+            msg = _EVENT_INFO_LOGS.get(event_type)
+            if msg is not None:
+                Log.info(msg)
+            else:
+                msg = _EVENT_DEBUG_LOGS.get(event_type)
+                if msg is not None:
+                    Log.debug(msg)
+                elif event_type == 'error':
+                    Log.error(f"[OpenAI] ❌ Error event: {response}")
+
+            # Only dispatch the extractor that handles this event type, so
+            # high-rate delta events skip three no-op awaited calls each.
+            if event_type in _LOG_EVENT_TYPES:
+                openai_service.process_event_for_logging(response)
+
+            if event_type == 'conversation.item.input_audio_transcription.completed':
+                await openai_service.extract_caller_transcript(response)
+            elif event_type == 'response.done' and not openai_service.is_human_in_control():
                 await openai_service.extract_ai_transcript(response)
 
         async def openai_receiver():
@@ -1142,7 +1482,7 @@ async def handle_media_stream(websocket: WebSocket):
 
         async def renew_openai_session():
             while True:
-                await asyncio.sleep(getattr(Config, "REALTIME_SESSION_RENEW_SECONDS", 1200))
+                await asyncio.sleep(_SESSION_RENEW_SECONDS)
                 try:
                     Log.info("Renewing OpenAI session…")
                     await connection_manager.close_openai_connection()
@@ -1153,34 +1493,34 @@ async def handle_media_stream(websocket: WebSocket):
                     Log.error(f"Session renewal failed: {e}")
 
         async def on_start_cb(stream_sid: str):
-            nonlocal current_call_sid, ai_stream_task, demo_session_id, demo_start_time, restaurant_id
+            nonlocal current_call_sid, demo_session_id, demo_start_time, restaurant_id
             
-            Log.header("=" * 80)
+            Log.header(_SEP80)
             Log.header("📞 TWILIO STREAM STARTED")
-            Log.header("=" * 80)
+            Log.header(_SEP80)
             
-            current_call_sid = getattr(connection_manager.state, 'call_sid', stream_sid)
+            current_call_sid = connection_manager.state.call_sid or stream_sid
             Log.event("Twilio Start", {"streamSid": stream_sid, "callSid": current_call_sid})
             
-            # Find demo session AND restaurant_id
-            for sid, data in demo_sessions.items():
-                if data.get('call_sid') == current_call_sid:
-                    demo_session_id = sid
-                    demo_start_time = time.time()
-                    restaurant_id = data.get('restaurant_id', 'default')
-                    Log.info(f"🎯 Found demo session: {demo_session_id}")
-                    Log.info(f"🏪 Restaurant ID: {restaurant_id}")
-                    Log.info(f"⏱️ Demo timer started - expires in {Config.DEMO_DURATION_SECONDS}s")
-                    
-                    broadcast_to_dashboards_nonblocking({
-                        "messageType": "callStarted",
-                        "callSid": current_call_sid,
-                        "sessionId": demo_session_id,
-                        "timestamp": int(time.time() * 1000)
-                    }, current_call_sid)
-                    
-                    break
-            
+            # Find demo session AND restaurant_id via the reverse index
+            # instead of scanning every session.
+            sid = sid_by_call.get(current_call_sid)
+            data = demo_sessions.get(sid) if sid else None
+            if data is not None:
+                demo_session_id = sid
+                demo_start_time = time.time()
+                restaurant_id = data.get('restaurant_id', 'default')
+                Log.info(f"🎯 Found demo session: {demo_session_id}")
+                Log.info(f"🏪 Restaurant ID: {restaurant_id}")
+                Log.info(f"⏱️ Demo timer started - expires in {_DEMO_DURATION_SECONDS}s")
+
+                broadcast_to_dashboards_nonblocking({
+                    "messageType": "callStarted",
+                    "callSid": current_call_sid,
+                    "sessionId": demo_session_id,
+                    "timestamp": time.time_ns() // 1_000_000
+                }, current_call_sid)
+
             if not demo_session_id:
                 Log.warning("⚠️ No demo session found for this call")
                 Log.info(f"📋 Available demo sessions: {list(demo_sessions.keys())}")
@@ -1192,10 +1532,6 @@ async def handle_media_stream(websocket: WebSocket):
             caller_silence_detector.reset()
             ai_silence_detector.reset()
             
-            if ai_stream_task is None or ai_stream_task.done():
-                ai_stream_task = asyncio.create_task(ai_audio_streamer())
-                Log.info("[AI Streamer] Task started")
-            
             active_calls[current_call_sid] = {
                 "restaurant_id": restaurant_id,
                 "openai_service": openai_service,
@@ -1209,10 +1545,12 @@ async def handle_media_stream(websocket: WebSocket):
             Log.info("🎧 Waiting for caller audio...")
 
             async def send_order_update(order_data: Dict[str, Any]):
+                if not _has_dashboards(current_call_sid):
+                    return
                 payload = {
                     "messageType": "orderUpdate",
                     "orderData": order_data,
-                    "timestamp": int(time.time() * 1000),
+                    "timestamp": time.time_ns() // 1_000_000,
                     "callSid": current_call_sid,
                 }
                 broadcast_to_dashboards_nonblocking(payload, current_call_sid)
@@ -1258,20 +1596,21 @@ async def handle_media_stream(websocket: WebSocket):
         # 🔥 Send call summary email (call ended during demo, not early)
         if current_call_sid:
             try:
-                # Find session info
+                # Find session info (O(1) via the reverse index)
                 session_info = None
-                for sid, data in demo_sessions.items():
-                    if data.get('call_sid') == current_call_sid:
+                sid = sid_by_call.get(current_call_sid)
+                if sid is not None:
+                    data = demo_sessions.get(sid)
+                    if data is not None:
                         session_info = {'session_id': sid, **data}
-                        break
-                
+
                 # Get call duration
                 call_duration = None
                 if demo_start_time:
                     call_duration = int(time.time() - demo_start_time)
                 
                 # Send summary email (NOT early - they made it to the demo)
-                send_call_summary_email(
+                queue_call_summary_email(
                     call_sid=current_call_sid,
                     session_id=session_info.get('session_id') if session_info else None,
                     phone=session_info.get('phone') if session_info else 'Unknown',
@@ -1282,13 +1621,6 @@ async def handle_media_stream(websocket: WebSocket):
             except Exception as e:
                 Log.error(f"Failed to send call summary email: {e}")
         
-        try:
-            await ai_audio_queue.put(None)
-            if ai_stream_task and not ai_stream_task.done():
-                await asyncio.wait([ai_stream_task], timeout=2.0)
-        except Exception:
-            pass
-        
         try:
             final_summary = order_extractor.get_order_summary()
             Log.info(f"\n{final_summary}")
@@ -1298,7 +1630,7 @@ async def handle_media_stream(websocket: WebSocket):
                     "messageType": "orderComplete",
                     "orderData": final_order,
                     "summary": final_summary,
-                    "timestamp": int(time.time() * 1000),
+                    "timestamp": time.time_ns() // 1_000_000,
                     "callSid": current_call_sid,
                 }, current_call_sid)
         except Exception:
@@ -1308,21 +1640,33 @@ async def handle_media_stream(websocket: WebSocket):
             del active_calls[current_call_sid]
             Log.info(f"[ActiveCalls] ❌ Removed call {current_call_sid}")
 
-        try:
-            await transcription_service.shutdown()
-        except Exception:
-            pass
+        # Independent teardown steps run concurrently: wall time is the
+        # slowest of the three instead of their sum, and a hung close can't
+        # stall the others past the shared timeout.
+        async def _do_cleanup():
+            results = await asyncio.gather(
+                transcription_service.shutdown(),
+                order_extractor.shutdown(),
+                connection_manager.close_openai_connection(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    Log.error(f"[Cleanup] Teardown step failed: {result}")
 
+        # Shielded so that cancellation of this handler (client hangup,
+        # server shutdown) doesn't abandon teardown mid-await and leak the
+        # OpenAI connection; the timeout still bounds a hung close.
         try:
-            await order_extractor.shutdown()
-        except Exception:
-            pass
+            async with asyncio.timeout(5.0):
+                await asyncio.shield(_do_cleanup())
+        except TimeoutError:
+            Log.warning("[Cleanup] Teardown timed out after 5s")
+        except asyncio.CancelledError:
+            Log.warning("[Cleanup] Handler cancelled; teardown finishing in background")
+        except Exception as e:
+            Log.error(f"[Cleanup] Teardown failed: {e}")
 
-        try:
-            await connection_manager.close_openai_connection()
-        except Exception:
-            pass
-        
         Log.info("✅ Media stream cleanup complete")
 
 
@@ -1334,4 +1678,12 @@ if __name__ == "__main__":
         port=int(os.environ.get("PORT", getattr(Config, "PORT", 8000))),
         log_level="info",
         reload=False,
+        # uvloop's event loop and httptools' parser cut per-await and
+        # per-request overhead for the WebSocket relay.
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        # On SIGTERM, give in-flight calls time to run their finally blocks
+        # (summary email, order broadcast, OpenAI close) before force-exit.
+        timeout_graceful_shutdown=int(os.environ.get("GRACEFUL_SHUTDOWN", 15)),
     )
@@ -251,31 +251,72 @@ class AudioService:
             "audio": converted_payload
         }
     
-    def process_outgoing_audio(self, openai_data: dict, stream_id: str) -> Optional[Dict[str, Any]]:
+    def process_incoming_payload(self, payload: str, timestamp: int) -> Dict[str, Any]:
         """
-        Process outgoing audio data from OpenAI.
-        
+        Process an incoming Twilio audio payload that is already extracted.
+
+        Performs the same timing/buffer bookkeeping as process_incoming_audio
+        but takes the payload and timestamp directly, for receivers that
+        pull them out of the frame without building the full event dict.
+
+        Args:
+            payload: Base64 audio payload from Twilio
+            timestamp: Twilio media timestamp in milliseconds
+
+        Returns:
+            Processed audio message for OpenAI
+        """
+        # Update timing
+        self.timing_manager.update_timestamp(timestamp)
+
+        # Convert format
+        converted_payload = self.format_converter.twilio_to_openai(payload)
+
+        # Create metadata
+        metadata = AudioMetadata(
+            timestamp=timestamp,
+            payload=converted_payload,
+            format_type=self.format_converter.OPENAI_FORMAT
+        )
+
+        # Add to buffer
+        self.buffer_manager.add_audio_chunk(converted_payload, metadata)
+
+        # Return OpenAI message
+        return {
+            "type": "input_audio_buffer.append",
+            "audio": converted_payload
+        }
+
+    def process_outgoing_audio_payload(self, openai_data: dict, stream_id: str) -> Optional[str]:
+        """
+        Process outgoing audio data from OpenAI and return the Twilio payload.
+
+        Performs the same timing/buffer bookkeeping as process_outgoing_audio
+        but returns only the converted base64 payload, for senders that splice
+        it into a pre-built media envelope.
+
         Args:
             openai_data: Raw data from OpenAI audio delta event
             stream_id: Twilio stream identifier
-            
+
         Returns:
-            Processed audio message for Twilio, or None if invalid
+            Converted base64 payload for Twilio, or None if invalid
         """
         # Extract audio data
         delta = openai_data.get('delta')
         item_id = openai_data.get('item_id')
-        
+
         if not delta:
             return None
-        
+
         # Handle timing for new responses
         if item_id and self.timing_manager.should_item_be_tracked(item_id):
             self.timing_manager.start_response_tracking(item_id)
-        
+
         # Convert format
         converted_payload = self.format_converter.openai_to_twilio(delta)
-        
+
         # Create metadata
         metadata = AudioMetadata(
             timestamp=self.timing_manager.current_timestamp,
@@ -284,10 +325,28 @@ class AudioService:
             payload=converted_payload,
             format_type=self.format_converter.TWILIO_FORMAT
         )
-        
+
         # Add to buffer
         self.buffer_manager.add_audio_chunk(converted_payload, metadata)
-        
+
+        return converted_payload
+
+    def process_outgoing_audio(self, openai_data: dict, stream_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Process outgoing audio data from OpenAI.
+
+        Args:
+            openai_data: Raw data from OpenAI audio delta event
+            stream_id: Twilio stream identifier
+
+        Returns:
+            Processed audio message for Twilio, or None if invalid
+        """
+        converted_payload = self.process_outgoing_audio_payload(openai_data, stream_id)
+
+        if converted_payload is None:
+            return None
+
         # Return Twilio message
         return {
             "event": "media",
@@ -1,13 +1,22 @@
-import json
 import asyncio
+import re
+import orjson
 import websockets
 from typing import Optional, Callable, Awaitable
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketDisconnect
 
-from config import Config
+from config import OPENAI_WS_URL, OPENAI_HEADERS
 from services.log_utils import Log
 
+# Media frames arrive ~50/sec per call and only two fields matter, so the
+# hot path detects them with a prefix check and pulls payload/timestamp out
+# with precompiled regexes instead of parsing the whole frame into a dict.
+# Base64 payloads cannot contain '"', so the payload pattern is exact.
+_MEDIA_FRAME_PREFIX = '{"event":"media"'
+_MEDIA_PAYLOAD_RE = re.compile(r'"payload":"([^"]+)"')
+_MEDIA_TIMESTAMP_RE = re.compile(r'"timestamp":"(\d+)"')
+
 
 class ConnectionState:
     """
@@ -18,10 +27,18 @@ class ConnectionState:
     
     Audio-related state is now managed by AudioService, so this class focuses only on connection/session state.
     """
-    
+
+    # Fixed attribute set: slots turn the per-frame reads of stream_sid /
+    # media_prefix into C-level offset loads instead of __dict__ lookups.
+    __slots__ = ("stream_sid", "call_sid", "media_prefix")
+
     def __init__(self):
         self.stream_sid: Optional[str] = None
         self.call_sid: Optional[str] = None
+        # Cached JSON envelope prefix for outbound media frames; only the
+        # base64 payload varies per frame, so the shell is built once per
+        # stream instead of dict+dumps per 20ms chunk.
+        self.media_prefix: Optional[str] = None
     
     def reset_stream_state(self) -> None:
         """Reset state when a new stream starts."""
@@ -55,12 +72,12 @@ class WebSocketConnectionManager:
         """Establish connection to OpenAI WebSocket API."""
         try:
             self.openai_ws = await websockets.connect(
-                Config.get_openai_websocket_url(),
-                additional_headers=Config.get_openai_headers()
+                OPENAI_WS_URL,
+                additional_headers=OPENAI_HEADERS
             )
             self._is_connected = True
             Log.event("OpenAI WebSocket Connected", {
-                "url": Config.get_openai_websocket_url()
+                "url": OPENAI_WS_URL
             })
         except Exception as e:
             Log.error(f"Failed to connect to OpenAI: {e}")
@@ -76,40 +93,94 @@ class WebSocketConnectionManager:
     async def send_to_openai(self, message: dict) -> None:
         """Send a message to OpenAI WebSocket."""
         if self.openai_ws and self._is_connected:
-            await self.openai_ws.send(json.dumps(message))
+            await self.openai_ws.send(orjson.dumps(message).decode())
         else:
             raise ConnectionError("OpenAI WebSocket is not connected")
     
+    async def send_raw_to_openai(self, message: str) -> None:
+        """Send a pre-serialized JSON string to OpenAI WebSocket.
+
+        Used for constant control messages that are encoded once at module
+        load instead of re-serialized per send. OpenAI expects text frames.
+        """
+        if self.openai_ws and self._is_connected:
+            await self.openai_ws.send(message)
+        else:
+            raise ConnectionError("OpenAI WebSocket is not connected")
+
     async def send_to_twilio(self, message: dict) -> None:
-        """Send a message to Twilio WebSocket."""
-        await self.twilio_ws.send_json(message)
+        """Send a message to Twilio WebSocket.
+
+        Serialized with orjson rather than Starlette's send_json (stdlib
+        json.dumps); Twilio requires text frames, hence the decode.
+        """
+        await self.twilio_ws.send_text(orjson.dumps(message).decode())
+
+    async def send_media_payload_to_twilio(self, payload_b64: str) -> None:
+        """Send a media frame by splicing the payload into the cached envelope.
+
+        Twilio media frames differ only in their base64 payload, so this skips
+        the per-frame dict construction and JSON serialization that
+        send_to_twilio would do. Twilio requires text frames, hence send_text.
+        """
+        prefix = self.state.media_prefix
+        if prefix is None:
+            await self.send_to_twilio({
+                "event": "media",
+                "streamSid": self.state.stream_sid,
+                "media": {"payload": payload_b64}
+            })
+            return
+        await self.twilio_ws.send_text(prefix + payload_b64 + '"}}')
     
     async def receive_from_twilio(
-        self, 
-        on_media: Callable[[dict], Awaitable[None]],
+        self,
+        on_media: Callable[[str, int], Awaitable[None]],
         on_start: Callable[[str], Awaitable[None]],
         on_mark: Callable[[], Awaitable[None]]
     ) -> None:
         """
         Receive messages from Twilio and route them to appropriate handlers.
-        
+
         Args:
-            on_media: Handler for media events
+            on_media: Handler for media events, called with (payload_b64, timestamp_ms)
             on_start: Handler for stream start events
             on_mark: Handler for mark events
         """
         try:
             async for message in self.twilio_ws.iter_text():
-                data = json.loads(message)
-                
+                # Fast path: media frames are identified by prefix and mined
+                # with regexes; only control events pay for a full parse.
+                if message.startswith(_MEDIA_FRAME_PREFIX):
+                    payload_match = _MEDIA_PAYLOAD_RE.search(message)
+                    if payload_match:
+                        ts_match = _MEDIA_TIMESTAMP_RE.search(message)
+                        await on_media(
+                            payload_match.group(1),
+                            int(ts_match.group(1)) if ts_match else 0
+                        )
+                    continue
+
+                # orjson parses the frame in C; Starlette only exposes text
+                # frames as str, so the utf-8 decode itself can't be skipped.
+                data = orjson.loads(message)
+
                 if data['event'] == 'media':
-                    await on_media(data)
+                    media = data.get('media') or {}
+                    payload = media.get('payload')
+                    if payload:
+                        await on_media(payload, int(media.get('timestamp') or 0))
                 elif data['event'] == 'start':
                     start_info = data.get('start', {})
                     stream_sid = start_info.get('streamSid')
                     call_sid = start_info.get('callSid') or start_info.get('call_id')
                     self.state.stream_sid = stream_sid
                     self.state.call_sid = call_sid
+                    if stream_sid:
+                        self.state.media_prefix = (
+                            '{"event":"media","streamSid":"' + stream_sid +
+                            '","media":{"payload":"'
+                        )
                     # Log the callSid if available, otherwise log the incoming start payload for debugging
                     if call_sid:
                         Log.event("Twilio Start", {
@@ -153,7 +224,7 @@ class WebSocketConnectionManager:
             from services.openai_service import OpenAIEventHandler
             
             async for openai_message in self.openai_ws:
-                response = json.loads(openai_message)
+                response = orjson.loads(openai_message)
                 
                 if OpenAIEventHandler.is_audio_delta_event(response):
                     await on_audio_delta(response)
@@ -0,0 +1,30 @@
+from typing import Optional
+
+import aiohttp
+
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared process-wide aiohttp session, creating it on first use.
+
+    Building a ClientSession per request forces a new connection pool and TLS
+    handshake every time; one shared session keeps connections alive across
+    calls (transliteration, order extraction, email) and reuses TLS sessions.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=32)
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (called from server shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
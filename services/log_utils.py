@@ -1,30 +1,56 @@
 from __future__ import annotations
+import os
 import json
 from datetime import datetime
 from typing import Any, Optional
 
 DASH = "-" * 70
 
+# Numeric levels mirror the stdlib logging scale so LOG_LEVEL=WARNING etc.
+# behave as expected. The per-level booleans are computed once at import;
+# callers can check Log.info_enabled() before building expensive f-strings
+# (form-data dumps, banners) so discarded messages cost a single bool test.
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+_LEVEL = _LEVELS.get(os.environ.get("LOG_LEVEL", "INFO").upper(), 20)
+_DEBUG_ON = _LEVEL <= 10
+_INFO_ON = _LEVEL <= 20
+_WARNING_ON = _LEVEL <= 30
+
+
 class Log:
     @staticmethod
     def _ts() -> str:
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    @staticmethod
+    def debug_enabled() -> bool:
+        return _DEBUG_ON
+
+    @staticmethod
+    def info_enabled() -> bool:
+        return _INFO_ON
+
     @staticmethod
     def line() -> None:
-        print(DASH)
+        if _INFO_ON:
+            print(DASH)
 
     @staticmethod
     def header(title: str) -> None:
-        print(f"\n{DASH}\n[{Log._ts()}] {title}\n{DASH}")
+        if _INFO_ON:
+            print(f"\n{DASH}\n[{Log._ts()}] {title}\n{DASH}")
 
     @staticmethod
     def subheader(title: str) -> None:
-        print(f"\n[{Log._ts()}] {title}\n{DASH}")
+        if _INFO_ON:
+            print(f"\n[{Log._ts()}] {title}\n{DASH}")
 
     @staticmethod
-    def info(msg: str) -> None:
-        print(f"[{Log._ts()}] {msg}")
+    def info(msg: str, *args: Any) -> None:
+        # Optional %-style args defer formatting past the level gate, so
+        # hot call sites pay nothing when the level is off.
+        if _INFO_ON:
+            print(f"[{Log._ts()}] {msg % args if args else msg}")
 
     @staticmethod
     def error(msg: str) -> None:
@@ -32,10 +58,13 @@ class Log:
 
     @staticmethod
     def warning(msg: str) -> None:
-        print(f"[{Log._ts()}] WARNING: {msg}")
+        if _WARNING_ON:
+            print(f"[{Log._ts()}] WARNING: {msg}")
 
     @staticmethod
     def event(title: str, details: Optional[dict[str, Any]] = None) -> None:
+        if not _INFO_ON:
+            return
         Log.header(title)
         if details is not None:
             try:
@@ -46,6 +75,8 @@ class Log:
 
     @staticmethod
     def json(label: str, data: Any) -> None:
+        if not _INFO_ON:
+            return
         Log.subheader(label)
         try:
             print(json.dumps(data, indent=2, ensure_ascii=False))
@@ -54,5 +85,6 @@ class Log:
         Log.line()
 
     @staticmethod
-    def debug(msg: str) -> None:
-        print(f"[{Log._ts()}] DEBUG: {msg}")
+    def debug(msg: str, *args: Any) -> None:
+        if _DEBUG_ON:
+            print(f"[{Log._ts()}] DEBUG: {msg % args if args else msg}")
@@ -67,6 +67,7 @@ class RomanScriptConverter:
             
             # Use GPT to transliterate
             import aiohttp
+            from services.http_client import get_session as get_http_session
             
             system_prompt = """You are a transliteration expert. Convert Urdu/Hindi script text to Roman (Latin) script while preserving the exact pronunciation.
 
@@ -96,21 +97,21 @@ Examples:
                 "max_tokens": 100
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=3)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        roman_text = data['choices'][0]['message']['content'].strip()
-                        Log.info(f"[Roman] ✅ Converted to: {roman_text}")
-                        return roman_text
-                    else:
-                        Log.error(f"[Roman] API failed: {resp.status}")
-                        return text
+            session = get_http_session()
+            async with session.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=3)
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    roman_text = data['choices'][0]['message']['content'].strip()
+                    Log.info(f"[Roman] ✅ Converted to: {roman_text}")
+                    return roman_text
+                else:
+                    Log.error(f"[Roman] API failed: {resp.status}")
+                    return text
                         
         except Exception as e:
             Log.error(f"[Roman] Conversion error: {e}")
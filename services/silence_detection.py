@@ -3,6 +3,13 @@ import numpy as np
 from typing import Optional
 from services.log_utils import Log
 
+# pybase64 decodes with SIMD kernels; the energy check runs per audio chunk,
+# so the decode is worth accelerating. Stdlib fallback keeps deploys portable.
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
 
 class SilenceDetector:
     """
@@ -28,7 +35,7 @@ class SilenceDetector:
     def calculate_audio_energy(audio_base64: str) -> float:
         """Calculate RMS energy of µ-law audio chunk."""
         try:
-            audio_bytes = base64.b64decode(audio_base64)
+            audio_bytes = _b64.b64decode(audio_base64)
             audio_array = np.frombuffer(audio_bytes, dtype=np.uint8)
             
             # For µ-law, silence is around 127-128
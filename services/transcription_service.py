@@ -4,6 +4,13 @@ import time
 from typing import Dict, Optional, Callable
 from services.log_utils import Log
 
+# pybase64 dispatches to SIMD kernels and is ~10x faster on the small
+# per-chunk payloads handled here; fall back to stdlib where unavailable.
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
 
 class TranscriptionService:
     """
@@ -60,6 +67,13 @@ class TranscriptionService:
         num_samples = len(audio_bytes)
         duration_seconds = num_samples / self.SAMPLE_RATE
         return duration_seconds
+
+    @staticmethod
+    def _b64_decoded_len(payload: str) -> int:
+        """Decoded byte count of a base64 string, without decoding it."""
+        if not payload:
+            return 0
+        return (len(payload) * 3) // 4 - payload[-2:].count('=')
     
     async def _stream_unified_audio(self):
         """
@@ -85,11 +99,10 @@ class TranscriptionService:
                 async with self._playback_lock:
                     
                     audio_b64 = audio_data.get("audio", "")
-                    try:
-                        audio_bytes = base64.b64decode(audio_b64)
-                        chunk_duration = self._calculate_chunk_duration(audio_bytes)
-                    except Exception as e:
-                        Log.debug(f"[Stream] Duration calc error: {e}")
+                    # Length arithmetic instead of decoding the whole chunk
+                    # just to measure it.
+                    chunk_duration = self._b64_decoded_len(audio_b64) / self.SAMPLE_RATE
+                    if chunk_duration <= 0:
                         chunk_duration = 0.02
                     
                     speaker_changed = (
@@ -143,20 +156,21 @@ class TranscriptionService:
         """
         try:
             if isinstance(audio_input, str):
-                audio_bytes = base64.b64decode(audio_input)
+                # Size comes from the encoded length; no decode needed.
+                size = self._b64_decoded_len(audio_input)
                 original_base64 = audio_input
             elif isinstance(audio_input, (bytes, bytearray)):
-                audio_bytes = bytes(audio_input)
-                original_base64 = base64.b64encode(audio_bytes).decode('ascii')
+                size = len(audio_input)
+                original_base64 = _b64.b64encode(bytes(audio_input)).decode('ascii')
             else:
                 return
-            
+
             # Queue for streaming
             audio_packet = {
                 "speaker": source,
                 "audio": original_base64,
                 "timestamp": int(time.time() * 1000),
-                "size": len(audio_bytes)
+                "size": size
             }
             await self._unified_audio_queue.put(audio_packet)
             
@@ -11,13 +11,25 @@ class TwilioService:
     TWILIO_VOICE = "Google.en-US-Chirp3-HD-Aoede"
     
     @staticmethod
-    def create_demo_intro_twiml(session_id: str, backend_url: str) -> str:
+    def create_demo_intro_twiml(session_id: str, backend_url: str,
+                                status_callback_url: Optional[str] = None) -> str:
         """
         TwiML that speaks dashboard URL and waits for key press to start demo.
         🔥 User can press any key to skip the URL announcement
+
+        status_callback_url is emitted as statusCallback attributes on the
+        root <Response> directly, instead of patching the rendered XML with
+        str.replace afterwards.
         """
-        response = VoiceResponse()
-        
+        if status_callback_url:
+            response = VoiceResponse(
+                status_callback=status_callback_url,
+                status_callback_method="POST",
+                status_callback_event="completed failed",
+            )
+        else:
+            response = VoiceResponse()
+
         # 🔥 Gather wraps EVERYTHING so user can skip anytime
         gather = Gather(
             num_digits=1,